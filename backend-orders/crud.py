@@ -1,119 +1,235 @@
-from typing import List, Dict, Any
-from database import database, orders, order_items
+import asyncio
+import os
+from collections import OrderedDict, defaultdict
+from operator import itemgetter
+from typing import List, Dict, Any, Mapping, Optional, Sequence, Tuple
+from database import database, orders, order_items, created_at_key
 import schemas
-from events import broadcast
-import time
-
-
-def _serialize_order(order_row: Dict[str, Any], items_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Map DB rows to frontend's Order shape (camelCase fields and nested items)."""
+from events import BROADCAST_URL, broadcast_soon
+import datetime
+import sqlalchemy
+from ulid import ULID
+
+
+class _OrderCache:
+    """Small LRU of serialized orders keyed by order id.
+
+    Entries are written through on create/update/read, so a hit is always the
+    latest state this process has seen. The cache is per-process and nothing tells
+    it about writes from other workers, so it is turned off when BROADCAST_URL is
+    set (the multi-worker setup) or ORDER_CACHE_SIZE=0.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def get(self, order_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(order_id)
+        if entry is not None:
+            self._entries.move_to_end(order_id)
+        return entry
+
+    def put(self, order: Dict[str, Any]):
+        if self.maxsize <= 0:
+            return
+        self._entries[order["id"]] = order
+        self._entries.move_to_end(order["id"])
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+_order_cache = _OrderCache(0 if BROADCAST_URL else int(os.getenv("ORDER_CACHE_SIZE", "1024")))
+
+# Hot-path statements are built once; each call only swaps in bind values via .params()
+_SELECT_ORDER = orders.select().where(orders.c.id == sqlalchemy.bindparam("oid"))
+_SELECT_ITEMS = order_items.select().where(order_items.c.order_id == sqlalchemy.bindparam("oid"))
+_CREATED_AT_KEY = created_at_key(orders.c.created_at)
+_LIST_ORDERS = (
+    orders.select()
+    .order_by(_CREATED_AT_KEY.desc(), orders.c.id.desc())
+    .limit(sqlalchemy.bindparam("limit"))
+)
+
+
+def _order_topics(order: Dict[str, Any]) -> List[str]:
+    """Broadcast topics an order event is relevant to."""
+    topics = [f"restaurant:{order['restaurantId']}", f"user:{order['user']}"]
+    if order["droneId"]:
+        topics.append(f"drone:{order['droneId']}")
+    return topics
+
+
+_ORDER_FIELDS = itemgetter(
+    "id", "user", "restaurant_id", "total", "delivery_location_id", "status", "created_at", "drone_id"
+)
+_ITEM_FIELDS = itemgetter("item_id", "name", "price", "quantity", "restaurant_id")
+
+
+def _serialize_order(order_row: Mapping[str, Any], items_rows: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Map DB rows (records or plain dicts) to frontend's Order shape (camelCase fields and nested items)."""
+    oid, user, rid, total, dlid, status, created_at, drone_id = _ORDER_FIELDS(order_row)
+    items = []
+    for it in items_rows:
+        item_id, name, price, quantity, item_rid = _ITEM_FIELDS(it)
+        items.append({
+            "id": item_id,
+            "name": name,
+            "price": float(price),
+            "quantity": int(quantity),
+            "restaurantId": item_rid,
+        })
     return {
-        "id": order_row["id"],
-        "user": order_row["user"],
-        "restaurantId": order_row["restaurant_id"],
-        "items": [
-            {
-                "id": it["item_id"],
-                "name": it["name"],
-                "price": float(it["price"]),
-                "quantity": int(it["quantity"]),
-                "restaurantId": it["restaurant_id"],
-            }
-            for it in items_rows
-        ],
-        "total": float(order_row["total"]),
-        "deliveryLocationId": order_row["delivery_location_id"],
-        "status": order_row["status"],
-        # Return ISO string for createdAt
-        "createdAt": (
-            order_row["created_at"].isoformat() if getattr(order_row["created_at"], "isoformat", None) else str(order_row["created_at"])  # sqlite may return str
-        ),
-        "droneId": order_row["drone_id"],
+        "id": oid,
+        "user": user,
+        "restaurantId": rid,
+        "items": items,
+        "total": float(total),
+        "deliveryLocationId": dlid,
+        "status": status,
+        # Return ISO string for createdAt (sqlite may return str)
+        "createdAt": created_at.isoformat() if hasattr(created_at, "isoformat") else str(created_at),
+        "droneId": drone_id,
     }
 
 
 async def _fetch_order_with_items(order_id: str) -> Dict[str, Any]:
-    order_row = await database.fetch_one(orders.select().where(orders.c.id == order_id))
+    # Submit both reads concurrently so their round trips overlap
+    order_row, items_rows = await asyncio.gather(
+        database.fetch_one(_SELECT_ORDER.params(oid=order_id)),
+        database.fetch_all(_SELECT_ITEMS.params(oid=order_id)),
+    )
     if not order_row:
         return None
-    items_rows = await database.fetch_all(
-        order_items.select().where(order_items.c.order_id == order_id)
-    )
-    return _serialize_order(dict(order_row), [dict(r) for r in items_rows])
+    full_order = _serialize_order(order_row, items_rows)
+    _order_cache.put(full_order)
+    return full_order
 
 
 async def create_order(order: schemas.OrderCreate):
-    # Use provided id or generate ORD-<ts>
-    order_id = order.id or f"ORD-{int(time.time() * 1000)}"
-
-    # Insert into orders table
-    await database.execute(
-        orders.insert().values(
-            id=order_id,
-            user=order.user,
-            restaurant_id=order.restaurantId,
-            total=order.total,
-            delivery_location_id=order.deliveryLocationId,
-            status=order.status.value if hasattr(order.status, "value") else order.status,
-            drone_id=order.droneId,
-        )
-    )
-
-    # Insert items
-    if order.items:
-        values = [
-            {
-                "order_id": order_id,
-                "item_id": it.id,
-                "name": it.name,
-                "price": it.price,
-                "quantity": it.quantity,
-                "restaurant_id": it.restaurantId,
-            }
-            for it in order.items
-        ]
-        query = order_items.insert()
-        await database.execute_many(query, values)
-
-    full_order = await _fetch_order_with_items(order_id)
-
-    # broadcast event
-    await broadcast({
+    # Use provided id or generate ORD-<ulid> (time-sortable, no same-millisecond collisions)
+    order_id = order.id or f"ORD-{ULID()}"
+
+    # created_at is set here rather than by the server default so the response
+    # can be built without re-reading the row.
+    order_row = {
+        "id": order_id,
+        "user": order.user,
+        "restaurant_id": order.restaurantId,
+        "total": order.total,
+        "delivery_location_id": order.deliveryLocationId,
+        "status": order.status,
+        "created_at": datetime.datetime.utcnow(),
+        "drone_id": order.droneId,
+    }
+    values = [
+        {
+            "order_id": order_id,
+            "item_id": it.id,
+            "name": it.name,
+            "price": it.price,
+            "quantity": it.quantity,
+            "restaurant_id": it.restaurantId,
+        }
+        for it in order.items
+    ]
+
+    # One transaction, and all items in a single multi-row INSERT
+    # (execute_many issues one statement per item)
+    async with database.transaction():
+        await database.execute(orders.insert().values(**order_row))
+        if values:
+            await database.execute(order_items.insert().values(values))
+
+    full_order = _serialize_order(order_row, values)
+    _order_cache.put(full_order)
+
+    # broadcast event (in the background so the response doesn't wait on WS fan-out)
+    broadcast_soon({
         "event": "order_created",
         "order": full_order,
-    })
+    }, _order_topics(full_order))
 
     return full_order
 
 
-async def get_orders() -> List[Dict[str, Any]]:
-    rows = await database.fetch_all(orders.select().order_by(orders.c.created_at.desc()))
-    results: List[Dict[str, Any]] = []
-    for row in rows:
-        results.append(await _fetch_order_with_items(row["id"]))
-    return results
+async def get_orders(limit: int = 50, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Return a page of orders, newest first, and the cursor for the next page (None on the last).
+
+    The cursor is "<createdAt>|<id>" of the last order returned; ids break createdAt ties.
+    Raises ValueError for a malformed cursor.
+    """
+    query = _LIST_ORDERS.params(limit=limit + 1)
+    if cursor:
+        created_at_str, sep, last_id = cursor.partition("|")
+        if not sep:
+            raise ValueError(f"invalid cursor: {cursor!r}")
+        # Compared through the same normalized key the list is ordered by
+        created_at = created_at_key(sqlalchemy.literal(
+            datetime.datetime.fromisoformat(created_at_str), sqlalchemy.DateTime
+        ))
+        query = query.where(sqlalchemy.or_(
+            _CREATED_AT_KEY < created_at,
+            sqlalchemy.and_(_CREATED_AT_KEY == created_at, orders.c.id < last_id),
+        ))
+    rows = await database.fetch_all(query)
+    if not rows:
+        return [], None
+    # One extra row was fetched to tell whether another page exists
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    # Fetch items for all orders in one query and group them in Python (avoids N+1)
+    # (built per call: databases renders postcompile params, which rules out an expanding bindparam)
+    items_rows = await database.fetch_all(
+        order_items.select().where(order_items.c.order_id.in_([r["id"] for r in rows]))
+    )
+    grouped: Dict[str, List[Mapping[str, Any]]] = defaultdict(list)
+    for it in items_rows:
+        grouped[it["order_id"]].append(it)
+    results = [_serialize_order(row, grouped[row["id"]]) for row in rows]
+    for full_order in results:
+        _order_cache.put(full_order)
+    next_cursor = f"{results[-1]['createdAt']}|{results[-1]['id']}" if has_more else None
+    return results, next_cursor
 
 
 async def get_order(order_id: str) -> Dict[str, Any]:
+    cached = _order_cache.get(order_id)
+    if cached is not None:
+        return cached
     return await _fetch_order_with_items(order_id)
 
 
 async def update_order(order_id: str, payload: schemas.OrderUpdate):
     values = {}
     if payload.status is not None:
-        values["status"] = payload.status.value if hasattr(payload.status, "value") else payload.status
+        values["status"] = payload.status
     if payload.droneId is not None:
         values["drone_id"] = payload.droneId
 
     if values:
-        await database.execute(orders.update().where(orders.c.id == order_id).values(**values))
-
-    full_order = await _fetch_order_with_items(order_id)
+        # RETURNING hands back the updated row, so only the items need a second read,
+        # and not even that when the order is cached (items never change after creation)
+        order_row = await database.fetch_one(
+            orders.update().where(orders.c.id == order_id).values(**values).returning(*orders.c)
+        )
+        if not order_row:
+            return None
+        cached = _order_cache.get(order_id)
+        if cached is not None:
+            full_order = _serialize_order(order_row, ())
+            full_order["items"] = cached["items"]
+        else:
+            items_rows = await database.fetch_all(_SELECT_ITEMS.params(oid=order_id))
+            full_order = _serialize_order(order_row, items_rows)
+        _order_cache.put(full_order)
+    else:
+        full_order = await get_order(order_id)
 
     if full_order:
-        await broadcast({
+        broadcast_soon({
             "event": "order_updated",
             "order": full_order,
-        })
+        }, _order_topics(full_order))
 
     return full_order
@@ -1,29 +1,132 @@
-from typing import List
+import asyncio
+import os
+import orjson
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 router = APIRouter()
 
-_active_connections: List[WebSocket] = []
+# Clients subscribed to this topic receive every event (the default on connect)
+ALL_TOPICS = "*"
+
+# topic -> sockets subscribed to it, and the reverse index used for cleanup
+_subscriptions: Dict[str, Set[WebSocket]] = defaultdict(set)
+_client_topics: Dict[WebSocket, Set[str]] = {}
+
+# Number of sends scheduled at once during a broadcast
+BROADCAST_BATCH_SIZE = 50
+
+# Optional pub/sub backend shared by all workers (e.g., redis://localhost:6379).
+# When unset, events are fanned out in-process only.
+BROADCAST_URL = os.getenv("BROADCAST_URL")
+ORDERS_CHANNEL = "orders"
+
+_broadcaster = None
+_relay_task: Optional[asyncio.Task] = None
+
+# Strong references to in-flight broadcast_soon tasks (the loop only keeps weak ones)
+_pending_broadcasts: Set[asyncio.Task] = set()
+
+def _subscribe(ws: WebSocket, topic: str):
+    _subscriptions[topic].add(ws)
+    _client_topics.setdefault(ws, set()).add(topic)
+
+def _unsubscribe(ws: WebSocket, topic: str):
+    conns = _subscriptions.get(topic)
+    if conns is not None:
+        conns.discard(ws)
+        if not conns:
+            del _subscriptions[topic]
+    topics = _client_topics.get(ws)
+    if topics is not None:
+        topics.discard(topic)
+
+def _drop(ws: WebSocket):
+    for topic in _client_topics.pop(ws, ()):
+        conns = _subscriptions.get(topic)
+        if conns is not None:
+            conns.discard(ws)
+            if not conns:
+                del _subscriptions[topic]
 
 @router.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await ws.accept()
-    _active_connections.append(ws)
+    _subscribe(ws, ALL_TOPICS)
     try:
         while True:
-            # keep connection alive; clients can send pings if they wish
-            await ws.receive_text()
+            # Clients may narrow their feed with {"topic": "restaurant:<id>"} (also user:<name>,
+            # drone:<id>); the first subscription replaces the default all-events feed.
+            # Anything else (e.g. pings) just keeps the connection alive.
+            text = await ws.receive_text()
+            try:
+                msg = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(msg, dict) and isinstance(msg.get("topic"), str):
+                _unsubscribe(ws, ALL_TOPICS)
+                _subscribe(ws, msg["topic"])
     except WebSocketDisconnect:
-        if ws in _active_connections:
-            _active_connections.remove(ws)
-
-async def broadcast(message: dict):
-    dead = []
-    for conn in _active_connections:
-        try:
-            await conn.send_json(message)
-        except Exception:
-            dead.append(conn)
+        _drop(ws)
+
+async def start():
+    """Connect to the pub/sub backend (if configured) and relay its events to local clients."""
+    global _broadcaster, _relay_task
+    if not BROADCAST_URL:
+        return
+    from broadcaster import Broadcast
+    _broadcaster = Broadcast(BROADCAST_URL)
+    await _broadcaster.connect()
+    _relay_task = asyncio.create_task(_relay())
+
+async def stop():
+    global _broadcaster, _relay_task
+    if _relay_task is not None:
+        _relay_task.cancel()
+        _relay_task = None
+    if _broadcaster is not None:
+        await _broadcaster.disconnect()
+        _broadcaster = None
+
+async def _relay():
+    async with _broadcaster.subscribe(channel=ORDERS_CHANNEL) as subscriber:
+        async for event in subscriber:
+            # Envelope is "<comma-separated topics>\n<payload>" (JSON payloads never contain a raw newline)
+            topics, _, payload = event.message.partition("\n")
+            await _fan_out(payload, topics.split(",") if topics else ())
+
+async def _fan_out(payload: str, topics: Iterable[str]):
+    recipients = set(_subscriptions.get(ALL_TOPICS, ()))
+    for topic in topics:
+        recipients.update(_subscriptions.get(topic, ()))
+    conns = list(recipients)
+    # One ASGI message shared by every send (send_text would build one per client).
+    # Uvicorn's websockets impl already writes each frame straight to the transport.
+    message = {"type": "websocket.send", "text": payload}
+    dead: Set[WebSocket] = set()
+    for i in range(0, len(conns), BROADCAST_BATCH_SIZE):
+        batch = conns[i:i + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(*(c.send(message) for c in batch), return_exceptions=True)
+        dead.update(c for c, r in zip(batch, results) if isinstance(r, Exception))
+        # yield to the event loop between batches
+        await asyncio.sleep(0)
     for d in dead:
-        if d in _active_connections:
-            _active_connections.remove(d)
+        _drop(d)
+
+async def broadcast(message: dict, topics: Iterable[str] = ()):
+    """Send an event to clients subscribed to any of `topics` plus all unscoped clients."""
+    topics = tuple(topics)
+    # Encode once for all recipients; sent as text since clients JSON.parse e.data
+    payload = orjson.dumps(message).decode()
+    if _broadcaster is not None:
+        # Every worker (including this one) receives it via _relay and fans out locally
+        await _broadcaster.publish(channel=ORDERS_CHANNEL, message=",".join(topics) + "\n" + payload)
+    else:
+        await _fan_out(payload, topics)
+
+def broadcast_soon(message: dict, topics: Iterable[str] = ()):
+    """Schedule broadcast() without waiting for the fan-out to finish."""
+    task = asyncio.create_task(broadcast(message, topics))
+    _pending_broadcasts.add(task)
+    task.add_done_callback(_pending_broadcasts.discard)
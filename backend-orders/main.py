@@ -1,10 +1,12 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional
 import crud, schemas, database
+import events
 from events import router as events_router
 
-app = FastAPI(title="Drone Delivery Orders Service")
+app = FastAPI(title="Drone Delivery Orders Service", default_response_class=ORJSONResponse)
 
 # allow your three frontends
 app.add_middleware(
@@ -13,6 +15,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # include websocket router
@@ -22,24 +25,45 @@ app.include_router(events_router)
 @app.on_event("startup")
 async def startup():
     await database.database.connect()
+    await events.start()
 
 @app.on_event("shutdown")
 async def shutdown():
+    await events.stop()
     await database.database.disconnect()
 
 # ------------------- REST API -------------------
-@app.post("/api/orders", response_model=schemas.Order)
+# CRUD already builds the exact Order shape, so handlers return ORJSONResponse directly
+# and skip FastAPI's second validation/encoding pass; `responses` keeps the OpenAPI schema.
+_ORDER_RESPONSE = {200: {"model": schemas.Order}}
+_ORDER_LIST_RESPONSE = {200: {"model": List[schemas.Order]}}
+
+def _order_response(order):
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return ORJSONResponse(order)
+
+@app.post("/api/orders", response_model=None, responses=_ORDER_RESPONSE)
 async def create_order(order: schemas.OrderCreate):
-    return await crud.create_order(order)
+    return _order_response(await crud.create_order(order))
 
-@app.get("/api/orders", response_model=List[schemas.Order])
-async def list_orders():
-    return await crud.get_orders()
+@app.get("/api/orders", response_model=None, responses=_ORDER_LIST_RESPONSE)
+async def list_orders(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+):
+    # Body stays a plain list; the cursor for the next page (if any) goes in a header
+    try:
+        results, next_cursor = await crud.get_orders(limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return ORJSONResponse(results, headers=headers)
 
-@app.get("/api/orders/{order_id}", response_model=schemas.Order)
+@app.get("/api/orders/{order_id}", response_model=None, responses=_ORDER_RESPONSE)
 async def get_order(order_id: str):
-    return await crud.get_order(order_id)
+    return _order_response(await crud.get_order(order_id))
 
-@app.patch("/api/orders/{order_id}", response_model=schemas.Order)
+@app.patch("/api/orders/{order_id}", response_model=None, responses=_ORDER_RESPONSE)
 async def update_order(order_id: str, payload: schemas.OrderUpdate):
-    return await crud.update_order(order_id, payload)
+    return _order_response(await crud.update_order(order_id, payload))
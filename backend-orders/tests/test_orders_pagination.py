@@ -0,0 +1,93 @@
+import asyncio
+import datetime
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# The service imports its modules top-level (`from database import ...`) and binds the
+# database at import time, so point it at a scratch file before importing anything
+_TMP = tempfile.TemporaryDirectory()
+DB_FILE = Path(_TMP.name) / "orders.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_FILE.as_posix()}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import crud  # noqa: E402
+import schemas  # noqa: E402
+from database import database  # noqa: E402
+
+
+def _insert_raw(order_id: str, created_at=None):
+    """Insert an order the way another writer would: raw SQL, server default unless created_at is given."""
+    conn = sqlite3.connect(DB_FILE)
+    cols = "id, user, restaurant_id, total, delivery_location_id"
+    vals = [order_id, "Student-1", "rest-1", 1.0, "A"]
+    if created_at is not None:
+        cols += ", created_at"
+        vals.append(created_at)
+    conn.execute(f"INSERT INTO orders ({cols}) VALUES ({', '.join('?' * len(vals))})", vals)
+    conn.commit()
+    conn.close()
+
+
+class MixedCreatedAtPaginationTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await database.connect()
+        await database.execute("DELETE FROM order_items")
+        await database.execute("DELETE FROM orders")
+        crud._order_cache._entries.clear()
+
+    async def asyncTearDown(self):
+        # Let create_order's background broadcasts finish before the loop closes
+        await asyncio.sleep(0)
+        await database.disconnect()
+
+    async def _page_through(self, limit: int):
+        ids, cursor, seen_cursors = [], None, set()
+        for _ in range(50):
+            page, cursor = await crud.get_orders(limit=limit, cursor=cursor)
+            ids.extend(o["id"] for o in page)
+            if cursor is None:
+                return ids
+            self.assertNotIn(cursor, seen_cursors, "cursor repeated; pagination would never end")
+            seen_cursors.add(cursor)
+        self.fail("pagination did not terminate")
+
+    async def test_pages_through_legacy_and_new_timestamps(self):
+        # "YYYY-MM-DD HH:MM:SS" (server default / other writers) mixed with SQLAlchemy's
+        # "YYYY-MM-DD HH:MM:SS.ffffff"; ORD-1 and ORD-5 tie on created_at
+        _insert_raw("ORD-1", "2024-01-01 10:00:00")
+        _insert_raw("ORD-2", "2024-01-01 10:00:00.500000")
+        _insert_raw("ORD-3", "2024-01-01 10:00:01")
+        _insert_raw("ORD-4", "2024-01-01 09:59:59.250000")
+        _insert_raw("ORD-5", "2024-01-01 10:00:00")
+        _insert_raw("ORD-6")  # server default, i.e. now
+        created = await crud.create_order(schemas.OrderCreate(
+            id="ORD-7", user="Student-1", restaurantId="rest-1", items=[],
+            total=1.0, deliveryLocationId="A",
+        ))
+        self.assertEqual(created["id"], "ORD-7")
+
+        expected = ["ORD-3", "ORD-2", "ORD-5", "ORD-1", "ORD-4"]
+        full, next_cursor = await crud.get_orders(limit=200)
+        self.assertIsNone(next_cursor)
+        # ORD-6 and ORD-7 are both "now"; their relative order depends on the clock
+        self.assertEqual(sorted(o["id"] for o in full[:2]), ["ORD-6", "ORD-7"])
+        self.assertEqual([o["id"] for o in full[2:]], expected)
+
+        for limit in (1, 2, 3):
+            self.assertEqual(await self._page_through(limit), [o["id"] for o in full])
+
+    async def test_legacy_row_with_limit_one_terminates(self):
+        await crud.create_order(schemas.OrderCreate(
+            id="ORD-1", user="Student-1", restaurantId="rest-1", items=[],
+            total=1.0, deliveryLocationId="A",
+        ))
+        _insert_raw("ORD-2", "2000-01-01 00:00:00")
+        self.assertEqual(await self._page_through(1), ["ORD-1", "ORD-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
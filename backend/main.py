@@ -1,37 +1,60 @@
 import time
 import threading
 import asyncio
-from typing import Dict, List, Optional
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from starlette.websockets import WebSocketState
 from pydantic import BaseModel
-import requests
+import httpx
 import collections
 import collections.abc
+from collections import deque
+from contextlib import contextmanager, suppress
+import logging
 import os
-# Compatibility shim for Python 3.10+: MutableMapping/MutableSet/Mapping moved to collections.abc
-if not hasattr(collections, "MutableMapping"):
+import sys
+# Compatibility shim for DroneKit on Python 3.10+: MutableMapping/MutableSet/Mapping moved to collections.abc
+# (older interpreters still have the aliases, so skip the patch there)
+if sys.version_info >= (3, 10):
     collections.MutableMapping = collections.abc.MutableMapping
-if not hasattr(collections, "MutableSet"):
     collections.MutableSet = collections.abc.MutableSet
-if not hasattr(collections, "Mapping"):
     collections.Mapping = collections.abc.Mapping
 from dronekit import connect, VehicleMode, LocationGlobalRelative
 from pymavlink import mavutil
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime
+from sqlalchemy import create_engine, event, update, Column, Integer, String, Float, DateTime
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import datetime
-import json
+import orjson
+try:
+    import msgpack  # optional: binary WebSocket frames for clients that ask for ?format=msgpack
+except ImportError:
+    msgpack = None
+from math import cos, hypot, radians
+from types import MappingProxyType
+
+# Per-tick mission progress (position, altitude, disarm polling) goes to this logger at DEBUG
+# so it costs nothing unless LOG_LEVEL=debug; milestones are still printed
+log = logging.getLogger("drone")
+if not log.handlers:
+    log.addHandler(logging.StreamHandler(sys.stdout))
+    log.propagate = False
+log.setLevel(logging.DEBUG if os.getenv("LOG_LEVEL", "info").lower() in ("debug", "trace") else logging.INFO)
 
 # Configuration
-BLOCK_COORDINATES = {
-    "A": {"lat": 16.4619833645846, "lon": 80.50799315633193},
-    "B": {"lat": 16.4630291, "lon": 80.5083940},
-    "C": {"lat": 16.460789852053995, "lon": 80.50785908615744},
-}
+# Read-only: looked up from request handlers and mission threads without any locking
+BLOCK_COORDINATES = MappingProxyType({
+    "A": MappingProxyType({"lat": 16.4619833645846, "lon": 80.50799315633193}),
+    "B": MappingProxyType({"lat": 16.4630291, "lon": 80.5083940}),
+    "C": MappingProxyType({"lat": 16.460789852053995, "lon": 80.50785908615744}),
+})
 
-HOME_LOCATION = {"lat": 16.463000, "lon": 80.507800}
+HOME_LOCATION = MappingProxyType({"lat": 16.463000, "lon": 80.507800})
 
 # Mission speed configuration (EASY TO TUNE)
 # Horizontal cruise speed used with simple_goto for Copter (m/s)
@@ -43,49 +66,230 @@ WPNAV_SPEED_MPS = 5.0        # horizontal speed (m/s)
 WPNAV_SPEED_UP_MPS = 2.0     # climb speed (m/s)
 WPNAV_SPEED_DN_MPS = 1.5     # descent speed (m/s)
 
+# Payload release servo (output channel and PWM for open/closed)
+PAYLOAD_SERVO_CHANNEL = 10
+PAYLOAD_SERVO_OPEN_PWM = 2000
+PAYLOAD_SERVO_CLOSED_PWM = 1000
+
 # Delay after landing/payload release before re-arming (seconds)
 # This provides time for the servo to fully actuate and the payload to clear safely
 PAYLOAD_RELEASE_DELAY_SECONDS = 5.0
 
-# Store drone connections by droneId
+# Navigation tolerances, in meters. Horizontal distances use a flat-earth (equirectangular)
+# approximation scaled at the target's latitude, which is accurate to well under 1% over a
+# delivery's few kilometers.
+ARRIVAL_THRESHOLD_M = 5.0                # destination / return-to-home reached
+ARRIVAL_THRESHOLD_SQ = ARRIVAL_THRESHOLD_M ** 2
+HOME_ARRIVAL_THRESHOLD_M = 10.0          # goto_home reached
+HOME_ARRIVAL_THRESHOLD_SQ = HOME_ARRIVAL_THRESHOLD_M ** 2
+NAV_PROGRESS_EPS_M = 0.05                # less movement than this per check counts as stalled
+DESCENT_PROGRESS_EPS_M = 0.05            # less descent than this per check counts as stalled
+
+# Meters per degree of latitude; a degree of longitude is this times cos(latitude)
+METERS_PER_DEG_LAT = 110540.0
+METERS_PER_DEG_LON_EQUATOR = 111320.0
+
+def _meters_per_degree(lat: float) -> Tuple[float, float]:
+    """(meters per degree of longitude, meters per degree of latitude) near `lat`."""
+    return METERS_PER_DEG_LON_EQUATOR * cos(radians(lat)), METERS_PER_DEG_LAT
+
+# What connect waits for before a drone is usable: just the state missions and status read.
+# DroneKit's wait_ready=True also waits for the full parameter download, which takes seconds
+# over a telemetry radio and which nothing here needs (parameters are set by name).
+CONNECT_READY_ATTRS = ('armed', 'mode', 'location.global_relative_frame')
+CONNECT_READY_TIMEOUT_SECONDS = 30
+
+# Telemetry stream rates requested from the FCU (Hz)
+TELEMETRY_POSITION_HZ = 5
+TELEMETRY_STATUS_HZ = 2
+
+# Upper bound on how long a mission wait sleeps between state re-checks (seconds);
+# waits normally wake as soon as DroneKit reports a new armed/mode/location value
+STATE_WAIT_FALLBACK_SECONDS = 1.0
+
+# How long close_connection waits for the job already running on a drone's worker thread
+# to finish before closing the vehicle under it (seconds)
+WORKER_JOIN_TIMEOUT_SECONDS = 5.0
+
+# Store drone connections by droneId. Writers mutate DRONES under DRONE_LOCK and then republish
+# DRONES_SNAPSHOT; readers iterate the snapshot without locking (the tuple swap is atomic).
+# A drone is always removed from DRONES before close_connection() runs, so the snapshot is
+# exactly the set of connected drones and readers needn't check is_connected per drone.
 DRONES: Dict[str, 'DroneDelivery'] = {}
 DRONE_LOCK = threading.Lock()
+DRONES_SNAPSHOT: Tuple[Tuple[str, 'DroneDelivery'], ...] = ()
+
+def _publish_drones():
+    """Rebuild DRONES_SNAPSHOT from DRONES; caller holds DRONE_LOCK."""
+    global DRONES_SNAPSHOT
+    DRONES_SNAPSHOT = tuple(DRONES.items())
+
+# Missions queued or running on drone worker threads; queued ones are cancelled on shutdown
+MISSION_FUTURES: Set[Future] = set()
+
+# Worker threads for blocking DroneKit connection setup and teardown; size it to the number of
+# drones that may be (re)connected at once (CONNECT_POOL_SIZE), since each holds a thread until
+# its link is ready
+CONNECT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CONNECT_POOL_SIZE", "4")),
+    thread_name_prefix="drone-connect",
+)
+
+# Per-client send timeout (seconds); a client that stalls longer is disconnected
+BROADCAST_SEND_TIMEOUT_SECONDS = 2.0
+# Frames buffered per WebSocket client before its oldest pending frame is dropped
+CLIENT_QUEUE_SIZE = 256
+# Most queued messages merged into one {"type":"batch"} frame when a client falls behind
+CLIENT_BATCH_MAX = 32
+
+# How often connected WebSocket clients get a status_update snapshot (seconds)
+STATUS_BROADCAST_INTERVAL_SECONDS = 2.0
+
+# Events queued by mission threads for WebSocket fan-out; newest events are dropped when full
+BROADCAST_QUEUE_SIZE = 256
+
+# Optional pub/sub backend shared by all workers (e.g., redis://localhost:6379). When set, every
+# event and status_update is published there and each worker relays it to its own clients;
+# when unset, events are fanned out in-process only.
+BROADCAST_URL = os.getenv("BROADCAST_URL")
+DRONES_CHANNEL = "drones"
+
+# Fixed-shape mission events, filled with already-encoded JSON values (orjson output is safe to
+# splice in as-is), so publishing one builds no dict and runs no encoder over the whole event
+ARRIVED_TEMPLATE = '{"type":"arrived_at_block","drone_id":%s,"order_id":%d,"block":%s}'
+DELIVERED_TEMPLATE = '{"type":"order_delivered","drone_id":%s,"order_id":%s}'
+COMPLETED_TEMPLATE = '{"type":"mission_completed","drone_id":%s,"order_id":%d,"block":%s}'
+FAILED_TEMPLATE = '{"type":"mission_failed","drone_id":%s,"order_id":%d,"error":%s}'
 
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
+        # websocket -> its outbound queue; each is drained by that connection's _pump task,
+        # so a broadcast only enqueues and never waits on a client
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._pumps: Dict[WebSocket, asyncio.Task] = {}
+        # Clients that asked for MessagePack binary frames instead of JSON text
+        self._binary: Set[WebSocket] = set()
+        # No lock: these maps are only touched from the event loop and never across an await,
+        # so connect/disconnect are O(1) dict/set updates and broadcast can walk them in place
+
+    async def connect(self, websocket: WebSocket, binary: bool = False):
         await websocket.accept()
-        self.active_connections.append(websocket)
-
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        outbox = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.active_connections[websocket] = outbox
+        if binary:
+            self._binary.add(websocket)
+        self._pumps[websocket] = asyncio.create_task(self._pump(websocket, outbox))
+
+    async def disconnect(self, websocket: WebSocket):
+        self.active_connections.pop(websocket, None)
+        self._binary.discard(websocket)
+        pump = self._pumps.pop(websocket, None)
+        if pump is not None and pump is not asyncio.current_task():
+            pump.cancel()
+
+    async def _pump(self, websocket: WebSocket, outbox: asyncio.Queue):
+        try:
+            while True:
+                message = await outbox.get()
+                if not outbox.empty():
+                    # Coalesce whatever else is already waiting into a single frame
+                    batch = [message]
+                    while not outbox.empty() and len(batch) < CLIENT_BATCH_MAX:
+                        batch.append(outbox.get_nowait())
+                    message = _batch_frame(batch)
+                send = websocket.send_bytes if isinstance(message, bytes) else websocket.send_text
+                await asyncio.wait_for(send(message), timeout=BROADCAST_SEND_TIMEOUT_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Send failed or the client stalled past the timeout: stop serving it and close the
+            # socket so the client sees the disconnect and its receive loop ends
+            await self.disconnect(websocket)
+            with suppress(Exception):
+                await asyncio.wait_for(websocket.close(), timeout=BROADCAST_SEND_TIMEOUT_SECONDS)
+
+    def _enqueue(self, outbox: asyncio.Queue, message):
+        if outbox.full():
+            # Slow client: drop its oldest pending frame rather than buffer without bound
+            outbox.get_nowait()
+        outbox.put_nowait(message)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
+        # Goes through the client's queue so frames to one socket are only ever sent by its pump
+        outbox = self.active_connections.get(websocket)
+        if outbox is not None:
+            self._enqueue(outbox, _to_msgpack(message) if websocket in self._binary else message)
+
+    async def broadcast_json(self, obj: dict):
+        """Encode `obj` once and broadcast the same text frame to every client."""
+        # Text frames, not bytes: the dashboard JSON.parses event.data as a string
+        await self.broadcast(orjson.dumps(obj).decode())
 
     async def broadcast(self, message: str):
+        # Sockets that are no longer open are dropped instead of queued for. Nothing in the loop
+        # awaits, so the dict can't change while it's iterated; removal happens afterwards.
         disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                # Mark for removal
+        packed = None
+        for connection, outbox in self.active_connections.items():
+            if connection.client_state != WebSocketState.CONNECTED:
                 disconnected.append(connection)
-        
-        # Remove disconnected clients
-        for conn in disconnected:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+            elif connection in self._binary:
+                if packed is None:
+                    # Converted once per broadcast, however many binary clients there are
+                    packed = _to_msgpack(message)
+                self._enqueue(outbox, packed)
+            else:
+                self._enqueue(outbox, message)
+        for connection in disconnected:
+            await self.disconnect(connection)
+
+def _to_msgpack(message: str) -> bytes:
+    return msgpack.packb(orjson.loads(message), use_bin_type=True)
+
+def _batch_frame(batch: list):
+    """Merge queued frames into one {"type":"batch","msgs":[...]} frame without re-encoding them."""
+    if isinstance(batch[0], bytes):
+        # A msgpack map/array is its header followed by the already-packed elements
+        packer = msgpack.Packer(use_bin_type=True)
+        return (packer.pack_map_header(2) + packer.pack("type") + packer.pack("batch")
+                + packer.pack("msgs") + packer.pack_array_header(len(batch)) + b"".join(batch))
+    return '{"type":"batch","msgs":[' + ",".join(batch) + ']}'
 
 manager = ConnectionManager()
 
 # Database setup
-engine = create_engine('sqlite:///drone_orders.db')
+# SQLite allows one writer at a time, so the engine keeps a single connection: mission
+# threads queue for it in the pool instead of racing each other into SQLITE_BUSY.
+engine = create_engine(
+    'sqlite:///drone_orders.db',
+    connect_args={"check_same_thread": False, "timeout": 5},
+    pool_size=1,
+    max_overflow=0,
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection: WAL so mission-thread writes don't block API reads,
+    NORMAL sync (safe under WAL, fewer fsyncs), and a busy timeout instead of immediate 'database is locked'."""
+    # Let SQLAlchemy emit BEGIN itself (see _begin_immediate) rather than pysqlite's deferred BEGIN
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+@event.listens_for(engine, "begin")
+def _begin_immediate(conn):
+    """Take the write lock when the transaction starts instead of upgrading from a read lock mid-way."""
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
 Base = declarative_base()
-SessionLocal = sessionmaker(bind=engine)
+WriteSession = sessionmaker(bind=engine)
 
 class Order(Base):
     __tablename__ = 'orders'
@@ -98,6 +302,41 @@ class Order(Base):
 
 Base.metadata.create_all(bind=engine)
 
+@contextmanager
+def mission_transaction(order_id: int):
+    """Yield checkpoint(**fields) for recording one mission's progress on its Order row.
+
+    The mission keeps a single WriteSession; each checkpoint is one UPDATE committed in its
+    own BEGIN IMMEDIATE transaction, and the connection goes back to the pool in between.
+    """
+    session = WriteSession()
+
+    def checkpoint(**fields):
+        try:
+            session.execute(update(Order).where(Order.id == order_id).values(**fields))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+    try:
+        yield checkpoint
+    finally:
+        session.close()
+
+def create_order(drone_id: str, block: str) -> int:
+    """Insert an IN_PROGRESS Order in one transaction and return its id.
+
+    Blocking (it may wait on the write lock); call it through run_in_threadpool from async code.
+    """
+    # Committed when the block exits (rolled back if it raises)
+    with WriteSession.begin() as session:
+        order = Order(drone_id=drone_id, block=block, status='IN_PROGRESS')
+        session.add(order)
+        # Read the id after flush: after commit the instance is expired and would be re-SELECTed
+        session.flush()
+        return order.id
+
 # Pydantic Models
 class LaunchRequest(BaseModel):
     droneId: str
@@ -123,12 +362,9 @@ class MissionResponse(BaseModel):
 class DroneDelivery:
     def __init__(self, connection_string: str):
         self.connection_string = connection_string
-        # Keep a ring buffer of recent STATUSTEXT messages from the FCU for better diagnostics
-        try:
-            from collections import deque
-            self._status_texts = deque(maxlen=50)
-        except Exception:
-            self._status_texts = []
+        # Keep a ring buffer of recent STATUSTEXT messages from the FCU for better diagnostics.
+        # Appended from DroneKit's listener thread; deque appends are atomic.
+        self._status_texts = deque(maxlen=50)
         # Support serial device strings with optional baud, e.g. "/dev/ttyUSB0@57600"
         try:
             if connection_string.startswith("/dev/"):
@@ -147,7 +383,7 @@ class DroneDelivery:
                 print(f"Connecting to serial device {conn} at baud {baud} ...")
                 self.vehicle = connect(
                     conn,
-                    wait_ready=True,
+                    wait_ready=False,
                     baud=baud,
                     heartbeat_timeout=60,
                 )
@@ -155,32 +391,78 @@ class DroneDelivery:
                 print(f"Connecting over network using '{connection_string}' ...")
                 self.vehicle = connect(
                     connection_string,
-                    wait_ready=True,
+                    wait_ready=False,
                     heartbeat_timeout=60,
                 )
+            try:
+                self.vehicle.wait_ready(*CONNECT_READY_ATTRS, timeout=CONNECT_READY_TIMEOUT_SECONDS)
+            except Exception:
+                self.vehicle.close()
+                raise
         except Exception as e:
             # Re-raise to be handled by API layer
             print(f"Connection attempt failed: {e}")
             raise
-        self.lock = threading.Lock()
+        # Flight commands run one job at a time on this drone's worker thread, which keeps
+        # MAVLink command order without locking and keeps missions off the request path.
+        # The thread itself is started last, once every attribute a job may touch exists.
+        self._cmd_q = queue.Queue()
+        # Notified from DroneKit's listener thread whenever armed/mode/location update,
+        # so mission waits wake on the MAVLink message instead of a fixed sleep
+        self._state_changed = threading.Condition()
+        # Bumped by the listeners whenever a field reported by get_status changes; DroneKit
+        # re-notifies on every MAVLink message, so the last seen values are kept to compare
+        self.status_version = 0
+        self._reported = {}  # type: Dict[str, object]
         self.is_connected = True
+        # COMMAND_LONG messages with fixed parameters are encoded once and re-sent as-is
+        factory = self.vehicle.message_factory
+        self._home_lock_msg = factory.command_long_encode(
+            0, 0,    # target_system, target_component
+            mavutil.mavlink.MAV_CMD_DO_SET_HOME,
+            0,       # confirmation
+            0,       # use current location
+            0, 0, 0, 0, 0, 0
+        )
+        self._disarm_msg = factory.command_long_encode(
+            0, 0,
+            mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM,
+            0,
+            0, 0, 0, 0, 0, 0, 0
+        )
+        # (channel, pwm) -> DO_SET_SERVO message; filled lazily by set_servo
+        self._servo_msgs = {}
+        for pwm in (PAYLOAD_SERVO_OPEN_PWM, PAYLOAD_SERVO_CLOSED_PWM):
+            self._servo_msg(PAYLOAD_SERVO_CHANNEL, pwm)
         # Will be set at mission start from current location
         self._home_location = None  # type: Optional[LocationGlobalRelative]
+        # Latest (lat, lon, relative alt), replaced as one tuple by the position listener so
+        # mission waits read plain floats instead of building a DroneKit location per check
+        frame = self.vehicle.location.global_relative_frame
+        self._position = (frame.lat, frame.lon, frame.alt)  # type: Tuple[Optional[float], Optional[float], Optional[float]]
         # Setup listeners after connection
         try:
             self._setup_listeners()
         except Exception as e:
             print(f"Warning: failed to set listeners: {e}")
+        try:
+            self._request_telemetry_streams()
+        except Exception as e:
+            print(f"Warning: failed to request telemetry streams: {e}")
         # Optionally standardize WPNAV speeds for consistent behavior
         if SET_WPNAV_PARAMS:
             try:
                 print("Setting WPNAV speed parameters for consistent groundspeed...")
-                self.vehicle.parameters['WPNAV_SPEED'] = int(WPNAV_SPEED_MPS * 100)      # cm/s
-                self.vehicle.parameters['WPNAV_SPEED_UP'] = int(WPNAV_SPEED_UP_MPS * 100)
-                self.vehicle.parameters['WPNAV_SPEED_DN'] = int(WPNAV_SPEED_DN_MPS * 100)
+                self._set_parameters({
+                    'WPNAV_SPEED': int(WPNAV_SPEED_MPS * 100),      # cm/s
+                    'WPNAV_SPEED_UP': int(WPNAV_SPEED_UP_MPS * 100),
+                    'WPNAV_SPEED_DN': int(WPNAV_SPEED_DN_MPS * 100),
+                })
                 print("WPNAV parameters set.")
             except Exception as e:
                 print(f"Warning: Failed to set WPNAV parameters: {e}")
+        self._worker = threading.Thread(target=self._run_loop, name=f"drone-{connection_string}", daemon=True)
+        self._worker.start()
 
     def _setup_listeners(self):
         """Attach useful listeners for diagnostics (e.g., STATUSTEXT)."""
@@ -191,13 +473,7 @@ class DroneDelivery:
                     severity = getattr(message, 'severity', None)
                     if text:
                         entry = f"STATUSTEXT[{severity}]: {text}"
-                        if isinstance(self._status_texts, list):
-                            self._status_texts.append(entry)
-                            # Trim list to last 50
-                            if len(self._status_texts) > 50:
-                                self._status_texts = self._status_texts[-50:]
-                        else:
-                            self._status_texts.append(entry)  # deque
+                        self._status_texts.append(entry)
                         # Also print immediately for live debugging
                         print(entry)
                 except Exception:
@@ -213,163 +489,299 @@ class DroneDelivery:
         except Exception as e:
             print(f"Listener setup error: {e}")
 
+        for attr in ('armed', 'mode'):
+            self.vehicle.add_attribute_listener(attr, self._on_state_update)
+        self.vehicle.add_attribute_listener('location.global_relative_frame', self._on_position_update)
+        self.vehicle.add_attribute_listener('battery', self._on_battery_update)
+
+    def _request_telemetry_streams(self):
+        """Ask the FCU for just the streams status reporting and mission waits rely on.
+
+        DroneKit's connect() has already requested every stream at 4 Hz, so those are
+        stopped first and only the two needed here are turned back on at their own rates.
+        """
+        master = self.vehicle._master
+        master.mav.request_data_stream_send(
+            master.target_system, master.target_component, mavutil.mavlink.MAV_DATA_STREAM_ALL, 0, 0)
+        for stream, rate_hz in (
+            (mavutil.mavlink.MAV_DATA_STREAM_POSITION, TELEMETRY_POSITION_HZ),            # GLOBAL_POSITION_INT
+            (mavutil.mavlink.MAV_DATA_STREAM_EXTENDED_STATUS, TELEMETRY_STATUS_HZ),       # SYS_STATUS (battery)
+        ):
+            master.mav.request_data_stream_send(master.target_system, master.target_component, stream, rate_hz, 1)
+
+    def _set_parameters(self, params: Dict[str, float], timeout: float = 2.0):
+        """Send all PARAM_SETs back-to-back and wait once for their PARAM_VALUE echoes.
+
+        DroneKit's `parameters[name] = value` waits for each echo in turn; anything not
+        confirmed within `timeout` falls back to that path.
+        """
+        pending = {name.upper(): float(value) for name, value in params.items()}
+        confirmed = threading.Event()
+        pending_lock = threading.Lock()
+
+        def _param_cb(_vehicle, _name, msg):
+            name = msg.param_id
+            if isinstance(name, bytes):
+                name = name.decode('ascii', 'ignore')
+            name = name.rstrip('\x00')
+            with pending_lock:
+                if name in pending and pending[name] == msg.param_value:
+                    del pending[name]
+                    if not pending:
+                        confirmed.set()
+
+        self.vehicle.add_message_listener('PARAM_VALUE', _param_cb)
+        try:
+            master = self.vehicle._master
+            for name, value in list(pending.items()):
+                master.param_set_send(name, value)
+            confirmed.wait(timeout)
+        finally:
+            self.vehicle.remove_message_listener('PARAM_VALUE', _param_cb)
+        with pending_lock:
+            unconfirmed = dict(pending)
+        for name, value in unconfirmed.items():
+            self.vehicle.parameters[name] = value
+
+    def _send_command_and_wait_ack(self, msg, command: int, timeout: float = 2.0) -> bool:
+        """Send a COMMAND_LONG and wait for the FCU's COMMAND_ACK for `command`.
+
+        Returns False if no ACK arrives within `timeout` seconds.
+        """
+        acked = threading.Event()
+
+        def _ack_cb(_vehicle, _name, ack):
+            if getattr(ack, 'command', None) == command:
+                acked.set()
+
+        self.vehicle.add_message_listener('COMMAND_ACK', _ack_cb)
+        try:
+            self.vehicle.send_mavlink(msg)
+            return acked.wait(timeout)
+        finally:
+            self.vehicle.remove_message_listener('COMMAND_ACK', _ack_cb)
+
+    def _note_reported(self, name, value):
+        """Bump status_version if value differs from the last one seen for name."""
+        if name not in self._reported or self._reported[name] != value:
+            self._reported[name] = value
+            self.status_version += 1
+
+    def _on_state_update(self, _vehicle, name, value):
+        self._note_reported(name, getattr(value, 'name', value) if name == 'mode' else value)
+        with self._state_changed:
+            self._state_changed.notify_all()
+
+    def _on_position_update(self, _vehicle, _name, frame):
+        position = (frame.lat, frame.lon, frame.alt)
+        if position != self._position:
+            self._position = position
+            self.status_version += 1
+        with self._state_changed:
+            self._state_changed.notify_all()
+
+    def _on_battery_update(self, _vehicle, name, battery):
+        # Only affects reported status; mission waits don't care
+        self._note_reported(name, getattr(battery, 'level', None))
+
+    def _wait_until(self, predicate, timeout: Optional[float] = None) -> bool:
+        """Block until predicate() is true, re-checking on every armed/mode/location update.
+
+        Also re-checks every STATE_WAIT_FALLBACK_SECONDS in case an update is missed.
+        Returns False if `timeout` seconds pass first (None waits indefinitely).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._state_changed:
+            while not predicate():
+                wait = STATE_WAIT_FALLBACK_SECONDS
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                self._state_changed.wait(wait)
+        return True
+
+    def _wait_for_update(self, timeout: float = STATE_WAIT_FALLBACK_SECONDS):
+        """Sleep until the next armed/mode/location update, or at most `timeout` seconds."""
+        with self._state_changed:
+            self._state_changed.wait(timeout)
+
+    def _simple_goto(self, target: LocationGlobalRelative):
+        """simple_goto at the mission groundspeed."""
+        try:
+            self.vehicle.simple_goto(target, groundspeed=MISSION_GROUNDSPEED_MPS)
+        except TypeError:
+            # Fallback if DroneKit version doesn't support groundspeed kwarg
+            self.vehicle.simple_goto(target)
+
     def arm_and_takeoff(self, target_altitude: float):
-        with self.lock:
-            print("Preparing to arm...")
-            # Ensure we are in GUIDED and the autopilot accepted the mode
-            self.vehicle.mode = VehicleMode("GUIDED")
-            while self.vehicle.mode.name != "GUIDED":
-                print(" Waiting for mode change...")
-                time.sleep(1)
+        print("Preparing to arm...")
+        # Ensure we are in GUIDED and the autopilot accepted the mode
+        self.vehicle.mode = VehicleMode("GUIDED")
+        print(" Waiting for mode change...")
+        self._wait_until(lambda: self.vehicle.mode.name == "GUIDED")
+
+        print("Arming motors...")
+        self.vehicle.armed = True
+        print(" Waiting for arming...")
+        self._wait_until(lambda: self.vehicle.armed)
+
+        # Lock home location to prevent changes during the mission (only after GPS ready)
+        try:
+            print("Locking home location to prevent changes...")
+            self.vehicle.send_mavlink(self._home_lock_msg)
+            print("Home position locked!")
+        except Exception as e:
+            print(f"Warning: failed to lock home location: {e}")
 
-            print("Arming motors...")
-            self.vehicle.armed = True
-            while not self.vehicle.armed:
-                print(" Waiting for arming...")
-                time.sleep(1)
+        if not self._wait_until(lambda: self.vehicle.armed, timeout=45):
+            recent_msgs = list(self._status_texts)
+            raise Exception(f"Arming timeout. Recent FCU messages: {recent_msgs[-5:]}")
 
-            # Lock home location to prevent changes during the mission (only after GPS ready)
-            try:
-                print("Locking home location to prevent changes...")
-                self.vehicle.send_mavlink(self.vehicle.message_factory.command_long_encode(
-                    0, 0,    # target_system, target_component
-                    mavutil.mavlink.MAV_CMD_DO_SET_HOME,
-                    0,       # confirmation
-                    0,       # use current location
-                    0, 0, 0, 0, 0, 0
-                ))
-                self.vehicle.flush()
-                print("Home position locked!")
-            except Exception as e:
-                print(f"Warning: failed to lock home location: {e}")
-
-            start = time.time()
-            while not self.vehicle.armed:
-                if time.time() - start > 45:
-                    recent_msgs = list(self._status_texts) if self._status_texts else []
-                    raise Exception(f"Arming timeout. Recent FCU messages: {recent_msgs[-5:]}")
-                print("Waiting for arming...")
-                time.sleep(1)
-
-            print("Taking off...")
-            self.vehicle.simple_takeoff(target_altitude)
-            while True:
-                alt = getattr(self.vehicle.location.global_relative_frame, 'alt', 0)
-                print(f"Altitude: {alt}")
-                if alt >= target_altitude * 0.95:
-                    print("Target altitude reached!")
-                    break
-                time.sleep(1)
+        print("Taking off...")
+        self.vehicle.simple_takeoff(target_altitude)
+        self._wait_until(
+            lambda: (self._position[2] or 0) >= target_altitude * 0.95
+        )
+        print(f"Altitude: {self._position[2]}")
+        print("Target altitude reached!")
 
     def goto_location(self, lat: float, lon: float, cruise_alt: float = 20, final_alt: float = 1, notify_callback=None, delivered_callback=None):
-        with self.lock:
-            # Save current home before leaving
-            print("Saving home location...")
+        self._save_home()
+        self._cruise_to(lat, lon, cruise_alt, leg="nav")
+        print("Destination reached!")
+        if notify_callback:
             try:
-                cur_loc = self.vehicle.location.global_relative_frame
-                self._home_location = LocationGlobalRelative(cur_loc.lat, cur_loc.lon, cur_loc.alt)
-            except Exception:
-                # Fallback attempt using global_frame
-                cur_loc = self.vehicle.location.global_frame
-                self._home_location = LocationGlobalRelative(cur_loc.lat, cur_loc.lon, 0)
-            print(f"Home saved: Lat={self._home_location.lat}, Lon={self._home_location.lon}")
+                notify_callback()
+            except Exception as e:
+                print(f"notify_callback error: {e}")
+
+        self._descend(lat, lon, final_alt)
+        self._land_and_disarm()
+        payload_dropped = self._drop_payload()
 
-            # Ensure we are in GUIDED mode before navigation
+        # Now wait for touchdown and auto-disarm
+        print("Waiting for disarm after landing...")
+        self._wait_until(lambda: not self.vehicle.armed)
+        print("Landed and disarmed.")
+
+        if delivered_callback and payload_dropped:
             try:
-                self.vehicle.mode = VehicleMode("GUIDED")
+                delivered_callback()
             except Exception as e:
-                print(f"Warning: failed to set GUIDED before navigation: {e}")
-            start = time.time()
-            while getattr(self.vehicle.mode, 'name', None) != "GUIDED" and time.time() - start < 10:
-                print(" Waiting for GUIDED mode before navigation...")
-                time.sleep(0.5)
+                print(f"delivered_callback error: {e}")
 
-            # Also try setting desired groundspeed attribute (some DK versions ignore kwarg)
-            try:
-                self.vehicle.groundspeed = MISSION_GROUNDSPEED_MPS
-            except Exception:
-                pass
+        # Safety pause to allow payload to fully release before re-arming
+        try:
+            print(f"Waiting {PAYLOAD_RELEASE_DELAY_SECONDS}s before re-arming (payload release settle time)...")
+            time.sleep(PAYLOAD_RELEASE_DELAY_SECONDS)
+        except Exception as e:
+            print(f"Warning: delay before re-arming interrupted: {e}")
 
-            # Fly to destination
-            print(f"Flying to destination: Lat={lat}, Lon={lon}, Alt={cruise_alt}")
-            target_location = LocationGlobalRelative(lat, lon, cruise_alt)
-            # Use groundspeed for Copter to ensure consistent speed
-            try:
-                self.vehicle.simple_goto(target_location, groundspeed=MISSION_GROUNDSPEED_MPS)
-            except TypeError:
-                # Fallback if DroneKit version doesn't support groundspeed kwarg
-                print("simple_goto groundspeed kwarg not supported; using default WPNAV speeds.")
-                self.vehicle.simple_goto(target_location)
-
-            # Wait until drone reaches the target location (simple geographic proximity)
-            last_distance = None
-            last_cmd_time = time.time()
-            while True:
-                # Make sure we stay in GUIDED; some FCUs may switch modes on failsafe
-                try:
-                    if getattr(self.vehicle.mode, 'name', None) != "GUIDED":
-                        print(f"Mode changed to {getattr(self.vehicle.mode, 'name', None)} during nav; resetting to GUIDED...")
-                        self.vehicle.mode = VehicleMode("GUIDED")
-                        # brief wait, but don't block long
-                        t0 = time.time()
-                        while getattr(self.vehicle.mode, 'name', None) != "GUIDED" and time.time() - t0 < 5:
-                            time.sleep(0.2)
-                except Exception as e:
-                    print(f"Mode check error: {e}")
+        self._rearm_and_takeoff(cruise_alt)
+        self._return(cruise_alt)
+        print("Mission complete. Landed and disarmed at home.")
+
+    def _save_home(self):
+        """Remember the launch point so the return leg can fly back to it."""
+        print("Saving home location...")
+        try:
+            cur_loc = self.vehicle.location.global_relative_frame
+            self._home_location = LocationGlobalRelative(cur_loc.lat, cur_loc.lon, cur_loc.alt)
+        except Exception:
+            # Fallback attempt using global_frame
+            cur_loc = self.vehicle.location.global_frame
+            self._home_location = LocationGlobalRelative(cur_loc.lat, cur_loc.lon, 0)
+        print(f"Home saved: Lat={self._home_location.lat}, Lon={self._home_location.lon}")
+
+    def _cruise_to(self, lat: float, lon: float, alt: float, leg: str):
+        """Fly to (lat, lon) at `alt` in GUIDED and return once within ARRIVAL_THRESHOLD_M."""
+        # Ensure we are in GUIDED mode before navigation
+        try:
+            self.vehicle.mode = VehicleMode("GUIDED")
+        except Exception as e:
+            print(f"Warning: failed to set GUIDED before {leg}: {e}")
+        print(f" Waiting for GUIDED mode before {leg}...")
+        self._wait_until(lambda: getattr(self.vehicle.mode, 'name', None) == "GUIDED", timeout=10)
 
-                current_lat = self.vehicle.location.global_relative_frame.lat
-                current_lon = self.vehicle.location.global_relative_frame.lon
-                distance = ((current_lat - lat)**2 + (current_lon - lon)**2) ** 0.5
-                print(f"Current Location: Lat={current_lat}, Lon={current_lon}, Distance={distance}")
+        target_location = LocationGlobalRelative(lat, lon, alt)
+        print(f"Flying to: Lat={lat}, Lon={lon}, Alt={alt}")
+        # Also try setting desired groundspeed attribute (some DK versions ignore kwarg)
+        try:
+            self.vehicle.groundspeed = MISSION_GROUNDSPEED_MPS
+        except Exception:
+            pass
+        self._simple_goto(target_location)
+
+        # Wait until drone reaches the target location (simple geographic proximity).
+        # Arrival is checked on every position update; progress logging and the
+        # stall check keep their 1 s cadence.
+        kx, ky = _meters_per_degree(lat)
+        last_distance = None
+        last_cmd_time = last_check_time = time.time()
+        while True:
+            # Make sure we stay in GUIDED; some FCUs may switch modes on failsafe
+            try:
+                if getattr(self.vehicle.mode, 'name', None) != "GUIDED":
+                    print(f"Mode changed to {getattr(self.vehicle.mode, 'name', None)} during {leg}; resetting to GUIDED...")
+                    self.vehicle.mode = VehicleMode("GUIDED")
+                    # brief wait, but don't block long
+                    self._wait_until(lambda: getattr(self.vehicle.mode, 'name', None) == "GUIDED", timeout=5)
+            except Exception as e:
+                print(f"Mode check error ({leg}): {e}")
+
+            current_lat, current_lon, _ = self._position
+            dx, dy = (current_lon - lon) * kx, (current_lat - lat) * ky
+            if dx * dx + dy * dy < ARRIVAL_THRESHOLD_SQ:
+                print(f"Current Location: Lat={current_lat}, Lon={current_lon}, Distance={hypot(dx, dy):.1f}m")
+                return
+            if time.time() - last_check_time >= 1:
+                last_check_time = time.time()
+                distance = hypot(dx, dy)
+                log.debug("Current Location: Lat=%s, Lon=%s, Distance=%.1fm", current_lat, current_lon, distance)
                 # If no progress, reissue the goto command periodically
                 try:
                     if last_distance is None:
                         last_distance = distance
                     else:
-                        progressed = distance < (last_distance - 5e-7)
+                        progressed = distance < (last_distance - NAV_PROGRESS_EPS_M)
                         if (not progressed) and (time.time() - last_cmd_time > 3):
-                            print("No movement detected, reissuing simple_goto...")
-                            try:
-                                self.vehicle.simple_goto(target_location, groundspeed=MISSION_GROUNDSPEED_MPS)
-                            except TypeError:
-                                self.vehicle.simple_goto(target_location)
+                            print(f"No movement detected during {leg}, reissuing simple_goto...")
+                            self._simple_goto(target_location)
                             last_cmd_time = time.time()
                         last_distance = distance
                 except Exception as e:
-                    print(f"Progress check error: {e}")
-                if distance < 0.00005:
-                    print("Destination reached!")
-                    if notify_callback:
-                        try:
-                            notify_callback()
-                        except Exception as e:
-                            print(f"notify_callback error: {e}")
-                    break
-                time.sleep(1)
-
-            print("Initiating LAND at destination...")
-            self.vehicle.mode = VehicleMode("LAND")
-            # Descend to landing altitude
-            print(f"Descending to {final_alt}m for landing...")
-            descend_target = LocationGlobalRelative(lat, lon, final_alt)
-            try:
-                self.vehicle.simple_goto(descend_target)
-            except Exception as e:
-                print(f"simple_goto to descend failed initially: {e}")
-            last_alt = None
-            last_cmd_time = time.time()
-            while True:
-                alt_now = getattr(self.vehicle.location.global_relative_frame, 'alt', None)
-                if alt_now is None:
-                    print("No altitude reading; continuing...")
-                    time.sleep(1)
-                    continue
+                    print(f"Progress check error ({leg}): {e}")
+            self._wait_for_update()
+
+    def _descend(self, lat: float, lon: float, final_alt: float):
+        """Switch to LAND and wait until the drone is down to `final_alt`."""
+        print("Initiating LAND at destination...")
+        print(f"Descending to {final_alt}m for landing...")
+        descend_target = LocationGlobalRelative(lat, lon, final_alt)
+        self.vehicle.mode = VehicleMode("LAND")
+        try:
+            self.vehicle.simple_goto(descend_target)
+        except Exception as e:
+            print(f"simple_goto to descend failed initially: {e}")
+        last_alt = None
+        last_cmd_time = last_check_time = time.time()
+        while True:
+            alt_now = self._position[2]
+            if alt_now is None:
+                log.debug("No altitude reading; continuing...")
+                self._wait_for_update()
+                continue
+            if alt_now <= final_alt * 1.1:
                 print(f"Altitude: {alt_now}")
-                if alt_now <= final_alt * 1.1:
-                    break
+                return
+            if time.time() - last_check_time >= 1:
+                last_check_time = time.time()
+                log.debug("Altitude: %s", alt_now)
                 # Re-issue descent if no progress
                 if last_alt is not None:
-                    progressed = alt_now < (last_alt - 0.05)
+                    progressed = alt_now < (last_alt - DESCENT_PROGRESS_EPS_M)
                     if (not progressed) and (time.time() - last_cmd_time > 3):
                         print("No descent progress, reissuing simple_goto for descent...")
                         try:
@@ -378,200 +790,109 @@ class DroneDelivery:
                             pass
                         last_cmd_time = time.time()
                 last_alt = alt_now
-                time.sleep(1)
+            self._wait_for_update()
 
-            # Land and disarm at destination first
-            print("Landing...")
+    def _land_and_disarm(self):
+        """Hold LAND until the FCU disarms, sending a disarm ourselves once near the ground."""
+        print("Landing...")
+        try:
+            self.vehicle.mode = VehicleMode("LAND")
+        except Exception as e:
+            print(f"Failed to set LAND mode: {e}")
+        # Wait for LAND mode acceptance (timeout + reissue)
+        print(" Waiting for LAND mode acceptance...")
+        if not self._wait_until(lambda: getattr(self.vehicle.mode, 'name', None) == "LAND", timeout=10):
+            print(f"LAND mode not accepted (current={getattr(self.vehicle.mode, 'name', None)}), retrying...")
             try:
                 self.vehicle.mode = VehicleMode("LAND")
-            except Exception as e:
-                print(f"Failed to set LAND mode: {e}")
-            # Wait for LAND mode acceptance (timeout + reissue)
-            t_land = time.time()
-            while getattr(self.vehicle.mode, 'name', None) != "LAND" and time.time() - t_land < 10:
-                print(" Waiting for LAND mode acceptance...")
-                time.sleep(0.5)
-            if getattr(self.vehicle.mode, 'name', None) != "LAND":
-                print(f"LAND mode not accepted (current={getattr(self.vehicle.mode, 'name', None)}), retrying...")
-                try:
-                    self.vehicle.mode = VehicleMode("LAND")
-                except Exception:
-                    pass
-
-            # Wait for disarm, with safe fallback disarm if close to ground
-            while self.vehicle.armed:
-                try:
-                    alt_now = getattr(self.vehicle.location.global_relative_frame, 'alt', 999)
-                    gs = getattr(self.vehicle, 'groundspeed', None)
-                except Exception:
-                    alt_now, gs = 999, None
-                print("Waiting for disarm after landing...")
-                # Safe disarm fallback: near ground and (optionally) moving slowly
-                if alt_now is not None and alt_now < 0.3:
-                    try:
-                        print("Near ground; sending safe disarm command via MAVLink...")
-                        disarm_msg = self.vehicle.message_factory.command_long_encode(
-                            0, 0,
-                            mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM,
-                            0,
-                            0, 0, 0, 0, 0, 0, 0
-                        )
-                        self.vehicle.send_mavlink(disarm_msg)
-                        self.vehicle.flush()
-                    except Exception as e:
-                        print(f"Failed to send disarm command: {e}")
-                time.sleep(1)
-            print("Landed and disarmed.")
-
-            # Actuate servo AFTER disarm as requested
-            payload_dropped = False
-            try:
-                print("Dropping payload via servo...")
-                self.set_servo(10, 2000)
-                time.sleep(2)
-                self.set_servo(10, 1000)
-                payload_dropped = True
-            except Exception as e:
-                print(f"Warning: servo actuation failed: {e}")
-
-            # Now wait for touchdown and auto-disarm
-            while self.vehicle.armed:
-                print("Waiting for disarm after landing...")
-                time.sleep(1)
-            print("Landed and disarmed.")
-
-            if delivered_callback and payload_dropped:
-                try:
-                    delivered_callback()
-                except Exception as e:
-                    print(f"delivered_callback error: {e}")
-
-            # Safety pause to allow payload to fully release before re-arming
-            try:
-                print(f"Waiting {PAYLOAD_RELEASE_DELAY_SECONDS}s before re-arming (payload release settle time)...")
-                time.sleep(PAYLOAD_RELEASE_DELAY_SECONDS)
-            except Exception as e:
-                print(f"Warning: delay before re-arming interrupted: {e}")
-
-            # Re-arm and take off again for return flight
-            print("Re-arming for return flight...")
-            self.vehicle.mode = VehicleMode("GUIDED")
-            self.vehicle.armed = True
-            while not self.vehicle.armed:
-                print("Waiting for re-arming...")
-                time.sleep(1)
-
-            print("Taking off for return flight...")
-            self.vehicle.simple_takeoff(cruise_alt)
-            while self.vehicle.location.global_relative_frame.alt < cruise_alt * 0.95:
-                print(f"Altitude: {self.vehicle.location.global_relative_frame.alt}")
-                time.sleep(1)
-            print("Reached cruise altitude.")
-
-            # Return to saved home location (robust navigation like outbound leg)
-            if self._home_location is None:
-                print("Warning: home location not set, using current as home.")
-                cur = self.vehicle.location.global_relative_frame
-                self._home_location = LocationGlobalRelative(cur.lat, cur.lon, cur.alt)
-
-            # Ensure GUIDED before return
-            try:
-                self.vehicle.mode = VehicleMode("GUIDED")
-            except Exception as e:
-                print(f"Warning: failed to set GUIDED before return: {e}")
-            t0 = time.time()
-            while getattr(self.vehicle.mode, 'name', None) != "GUIDED" and time.time() - t0 < 10:
-                print(" Waiting for GUIDED before return...")
-                time.sleep(0.5)
-
-            # Try setting groundspeed attribute too
-            try:
-                self.vehicle.groundspeed = MISSION_GROUNDSPEED_MPS
             except Exception:
                 pass
 
-            home_target = LocationGlobalRelative(self._home_location.lat, self._home_location.lon, cruise_alt)
-            print(f"Returning to saved home point: Lat={self._home_location.lat}, Lon={self._home_location.lon}")
-            try:
-                self.vehicle.simple_goto(home_target, groundspeed=MISSION_GROUNDSPEED_MPS)
-            except TypeError:
-                self.vehicle.simple_goto(home_target)
-
-            last_distance = None
-            last_cmd_time = time.time()
-            while True:
-                # Stay in GUIDED during return
+        # Wait for disarm, with safe fallback disarm if close to ground
+        while self.vehicle.armed:
+            alt_now = self._position[2]
+            log.debug("Waiting for disarm after landing...")
+            # Safe disarm fallback: near ground
+            if alt_now is not None and alt_now < 0.3:
                 try:
-                    if getattr(self.vehicle.mode, 'name', None) != "GUIDED":
-                        print(f"Mode changed to {getattr(self.vehicle.mode, 'name', None)} during return; resetting to GUIDED...")
-                        self.vehicle.mode = VehicleMode("GUIDED")
-                        t1 = time.time()
-                        while getattr(self.vehicle.mode, 'name', None) != "GUIDED" and time.time() - t1 < 5:
-                            time.sleep(0.2)
+                    print("Near ground; sending safe disarm command via MAVLink...")
+                    acked = self._send_command_and_wait_ack(self._disarm_msg, mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM)
+                    if not acked:
+                        print("No COMMAND_ACK for disarm yet; will retry if still armed.")
                 except Exception as e:
-                    print(f"Mode check error (return): {e}")
+                    print(f"Failed to send disarm command: {e}")
+            self._wait_until(lambda: not self.vehicle.armed, timeout=1)
+        print("Landed and disarmed.")
 
-                current_lat = self.vehicle.location.global_relative_frame.lat
-                current_lon = self.vehicle.location.global_relative_frame.lon
-                distance = ((current_lat - self._home_location.lat)**2 + (current_lon - self._home_location.lon)**2) ** 0.5
-                print(f"Current Location: Lat={current_lat}, Lon={current_lon}, Distance={distance}")
-                try:
-                    if last_distance is None:
-                        last_distance = distance
-                    else:
-                        progressed = distance < (last_distance - 5e-7)
-                        if (not progressed) and (time.time() - last_cmd_time > 3):
-                            print("No movement detected on return, reissuing simple_goto...")
-                            try:
-                                self.vehicle.simple_goto(home_target, groundspeed=MISSION_GROUNDSPEED_MPS)
-                            except TypeError:
-                                self.vehicle.simple_goto(home_target)
-                            last_cmd_time = time.time()
-                        last_distance = distance
-                except Exception as e:
-                    print(f"Progress check error (return): {e}")
-
-                if distance < 0.00005:
-                    print("Returned to home!")
-                    break
-                time.sleep(1)
-
-            print("Stabilizing before landing at home...")
+    def _drop_payload(self) -> bool:
+        """Open then close the payload servo (after disarm); returns whether it actuated."""
+        try:
+            print("Dropping payload via servo...")
+            self.set_servo(PAYLOAD_SERVO_CHANNEL, PAYLOAD_SERVO_OPEN_PWM)
             time.sleep(2)
-            print("Landing at home location...")
-            self.vehicle.mode = VehicleMode("LAND")
-            while self.vehicle.armed:
-                print("Waiting for disarm after landing...")
-                time.sleep(1)
-
-            print("Mission complete. Landed and disarmed at home.")
+            self.set_servo(PAYLOAD_SERVO_CHANNEL, PAYLOAD_SERVO_CLOSED_PWM)
+            return True
+        except Exception as e:
+            print(f"Warning: servo actuation failed: {e}")
+            return False
+
+    def _rearm_and_takeoff(self, cruise_alt: float):
+        """Re-arm in GUIDED and climb back to cruise altitude for the return flight."""
+        print("Re-arming for return flight...")
+        self.vehicle.mode = VehicleMode("GUIDED")
+        self.vehicle.armed = True
+        print("Waiting for re-arming...")
+        self._wait_until(lambda: self.vehicle.armed)
+
+        print("Taking off for return flight...")
+        self.vehicle.simple_takeoff(cruise_alt)
+        self._wait_until(lambda: (self._position[2] or 0) >= cruise_alt * 0.95)
+        print(f"Altitude: {self._position[2]}")
+        print("Reached cruise altitude.")
+
+    def _return(self, cruise_alt: float):
+        """Fly back to the saved home point and land there."""
+        if self._home_location is None:
+            print("Warning: home location not set, using current as home.")
+            cur = self.vehicle.location.global_relative_frame
+            self._home_location = LocationGlobalRelative(cur.lat, cur.lon, cur.alt)
+
+        print(f"Returning to saved home point: Lat={self._home_location.lat}, Lon={self._home_location.lon}")
+        self._cruise_to(self._home_location.lat, self._home_location.lon, cruise_alt, leg="return")
+        print("Returned to home!")
+
+        print("Stabilizing before landing at home...")
+        time.sleep(2)
+        print("Landing at home location...")
+        self.vehicle.mode = VehicleMode("LAND")
+        print("Waiting for disarm after landing...")
+        self._wait_until(lambda: not self.vehicle.armed)
 
     def goto_home(self):
-        with self.lock:
-            # Prefer saved home; fallback to constant
-            if self._home_location is None:
-                lat, lon = HOME_LOCATION["lat"], HOME_LOCATION["lon"]
-            else:
-                lat, lon = self._home_location.lat, self._home_location.lon
-            print(f"Returning to home: Lat={lat}, Lon={lon}")
-            try:
-                self.vehicle.simple_goto(LocationGlobalRelative(lat, lon, 10), groundspeed=MISSION_GROUNDSPEED_MPS)
-            except TypeError:
-                self.vehicle.simple_goto(LocationGlobalRelative(lat, lon, 10))
-            while True:
-                current_lat = self.vehicle.location.global_relative_frame.lat
-                current_lon = self.vehicle.location.global_relative_frame.lon
-                distance = ((current_lat - lat)**2 + (current_lon - lon)**2) ** 0.5
-                print(f"Current Location: Lat={current_lat}, Lon={current_lon}, Distance={distance}")
-                if distance < 0.0001:
-                    print("Home reached!")
-                    break
-                time.sleep(1)
-            print("Landing at home...")
-            self.vehicle.mode = VehicleMode("LAND")
-            while self.vehicle.armed:
-                print("Waiting for landing at home...")
-                time.sleep(1)
+        # Prefer saved home; fallback to constant
+        if self._home_location is None:
+            lat, lon = HOME_LOCATION["lat"], HOME_LOCATION["lon"]
+        else:
+            lat, lon = self._home_location.lat, self._home_location.lon
+        print(f"Returning to home: Lat={lat}, Lon={lon}")
+        self._simple_goto(LocationGlobalRelative(lat, lon, 10))
+        kx, ky = _meters_per_degree(lat)
+
+        def _home_offset():
+            current_lat, current_lon, _ = self._position
+            return (current_lon - lon) * kx, (current_lat - lat) * ky
+
+        def _at_home():
+            dx, dy = _home_offset()
+            return dx * dx + dy * dy < HOME_ARRIVAL_THRESHOLD_SQ
+
+        self._wait_until(_at_home)
+        print(f"Current Location: Lat={self._position[0]}, Lon={self._position[1]}, Distance={hypot(*_home_offset()):.1f}m")
+        print("Home reached!")
+        print("Landing at home...")
+        self.vehicle.mode = VehicleMode("LAND")
+        print("Waiting for landing at home...")
+        self._wait_until(lambda: not self.vehicle.armed)
 
     def set_servo(self, channel: int, pwm_value: int):
         """
@@ -580,30 +901,49 @@ class DroneDelivery:
         pwm_value: PWM value (1000–2000 µs typical)
         """
         print(f"Setting servo at channel {channel} to PWM {pwm_value}")
-        msg = self.vehicle.message_factory.command_long_encode(
-            0, 0,                                    # target system, target component
-            mavutil.mavlink.MAV_CMD_DO_SET_SERVO,    # command
-            0,                                       # confirmation
-            channel,                                 # servo number
-            pwm_value,                               # PWM value
-            0, 0, 0, 0, 0                            # unused params
-        )
-        self.vehicle.send_mavlink(msg)
-        self.vehicle.flush()
+        self.vehicle.send_mavlink(self._servo_msg(channel, pwm_value))
+
+    def _servo_msg(self, channel: int, pwm_value: int):
+        """Return the (cached) DO_SET_SERVO COMMAND_LONG for this channel/PWM pair."""
+        msg = self._servo_msgs.get((channel, pwm_value))
+        if msg is None:
+            msg = self.vehicle.message_factory.command_long_encode(
+                0, 0,                                    # target system, target component
+                mavutil.mavlink.MAV_CMD_DO_SET_SERVO,    # command
+                0,                                       # confirmation
+                channel,                                 # servo number
+                pwm_value,                               # PWM value
+                0, 0, 0, 0, 0                            # unused params
+            )
+            self._servo_msgs[(channel, pwm_value)] = msg
+        return msg
 
     def get_status(self) -> DroneStatus:
         try:
-            location = self.vehicle.location.global_relative_frame
+            # Read position/battery straight from pymavlink's last-message cache; DroneKit's
+            # location and battery properties build new wrapper objects on every access
+            messages = getattr(getattr(self.vehicle, '_master', None), 'messages', {})
+            pos = messages.get('GLOBAL_POSITION_INT')
+            if pos is not None:
+                lat, lon, alt = pos.lat / 1e7, pos.lon / 1e7, pos.relative_alt / 1000.0
+            else:
+                lat, lon, alt = self._position
+            sys_status = messages.get('SYS_STATUS')
+            if sys_status is not None:
+                # -1 means the FCU doesn't know the remaining capacity
+                battery = sys_status.battery_remaining if sys_status.battery_remaining >= 0 else None
+            else:
+                battery = getattr(getattr(self.vehicle, 'battery', None), 'level', None)
             return DroneStatus(
                 armed=self.vehicle.armed,
                 mode=self.vehicle.mode.name,
-                altitude=location.alt,
+                altitude=alt,
                 connection_string=self.connection_string,
-                battery=getattr(getattr(self.vehicle, 'battery', None), 'level', None),
+                battery=battery,
                 location={
-                    "lat": location.lat,
-                    "lon": location.lon,
-                    "alt": location.alt
+                    "lat": lat,
+                    "lon": lon,
+                    "alt": alt
                 }
             )
         except Exception as e:
@@ -617,9 +957,41 @@ class DroneDelivery:
                 location=None
             )
 
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Queue fn(*args, **kwargs) on this drone's worker thread; returns its Future."""
+        fut = Future()
+        self._cmd_q.put((fn, args, kwargs, fut))
+        return fut
+
+    def _run_loop(self):
+        while True:
+            job = self._cmd_q.get()
+            if job is None:
+                return
+            fn, args, kwargs, fut = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                fut.set_exception(e)
+
     def close_connection(self):
         print("Closing connection...")
         self.is_connected = False
+        # Missions still waiting in the queue would otherwise run later against a closed vehicle
+        while True:
+            try:
+                job = self._cmd_q.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job[3].cancel()
+        self._cmd_q.put(None)
+        if self._worker is not threading.current_thread():
+            self._worker.join(WORKER_JOIN_TIMEOUT_SECONDS)
+            if self._worker.is_alive():
+                print(f"Warning: worker for {self.connection_string} still busy; closing anyway")
         self.vehicle.close()
 
     def perform_delivery(self, block_coords, home_coords, notify_callback=None, delivered_callback=None):
@@ -635,7 +1007,8 @@ class DroneDelivery:
 app = FastAPI(
     title="Drone Delivery API",
     description="Real-time drone delivery system for college campus",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware (configurable via env CORS_ORIGINS; use '*' or comma-separated list)
@@ -645,6 +1018,9 @@ if CORS_ORIGINS_ENV.strip() == "*":
 else:
     ALLOW_ORIGINS = [o.strip() for o in CORS_ORIGINS_ENV.split(",") if o.strip()]
 
+# Orders Service that delivered orders are synced to
+ORDERS_API_BASE = os.getenv("ORDERS_API_BASE", "http://127.0.0.1:8001")
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOW_ORIGINS,  # In production, specify your frontend URL(s)
@@ -653,6 +1029,149 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def startup():
+    app.state.loop = asyncio.get_running_loop()
+    app.state.tx_queue = asyncio.Queue(maxsize=BROADCAST_QUEUE_SIZE)
+    # Shared keep-alive client for outbound calls to the Orders Service
+    # (retries only re-attempt failed connects, so a PATCH is never sent twice)
+    app.state.http = httpx.AsyncClient(
+        base_url=ORDERS_API_BASE,
+        timeout=5.0,
+        transport=httpx.AsyncHTTPTransport(retries=2, limits=httpx.Limits(max_keepalive_connections=32)),
+    )
+    app.state.pubsub = None
+    app.state.relay_task = None
+    if BROADCAST_URL:
+        from broadcaster import Broadcast
+        app.state.pubsub = Broadcast(BROADCAST_URL)
+        await app.state.pubsub.connect()
+        app.state.relay_task = asyncio.create_task(_relay(app.state.pubsub))
+    app.state.broadcaster_task = asyncio.create_task(_broadcaster(app.state.tx_queue))
+    app.state.status_task = asyncio.create_task(_status_ticker())
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.broadcaster_task.cancel()
+    app.state.status_task.cancel()
+    # Missions still waiting for their drone won't start; one already flying is left to finish
+    for fut in list(MISSION_FUTURES):
+        fut.cancel()
+    if app.state.relay_task is not None:
+        app.state.relay_task.cancel()
+    if app.state.pubsub is not None:
+        await app.state.pubsub.disconnect()
+    await app.state.http.aclose()
+
+async def _broadcaster(tx_queue: asyncio.Queue):
+    """Single consumer that fans queued (already encoded) mission events out to WebSocket clients."""
+    while True:
+        payload = await tx_queue.get()
+        try:
+            await _fan_out(payload)
+        except Exception as e:
+            print(f"Broadcast error: {e}")
+
+async def _fan_out(payload: str):
+    """Send an encoded frame to every client: via the pub/sub backend if configured, else locally."""
+    pubsub = app.state.pubsub
+    if pubsub is not None:
+        # Every worker (including this one) receives it via _relay and broadcasts locally
+        await pubsub.publish(channel=DRONES_CHANNEL, message=payload)
+    else:
+        await manager.broadcast(payload)
+
+async def _relay(pubsub):
+    """Broadcast frames published by any worker to this worker's WebSocket clients."""
+    async with pubsub.subscribe(channel=DRONES_CHANNEL) as subscriber:
+        async for event in subscriber:
+            try:
+                await manager.broadcast(event.message)
+            except Exception as e:
+                print(f"Relay error: {e}")
+
+# drone_id -> (drone, status_version, encoded DroneStatus, '"<drone_id>":<encoded DroneStatus>');
+# the drone is kept so a reconnect under the same id (version back at 0) isn't served stale data.
+# Only touched from the event loop.
+STATUS_CACHE: Dict[str, Tuple['DroneDelivery', int, str, str]] = {}
+
+def _cached_status(drone_id: str, drone: 'DroneDelivery') -> Tuple['DroneDelivery', int, str, str]:
+    """STATUS_CACHE entry for this drone, re-encoding get_status() only if its status changed."""
+    cached = STATUS_CACHE.get(drone_id)
+    if cached is None or cached[0] is not drone or cached[1] != drone.status_version:
+        version = drone.status_version
+        status_json = orjson.dumps(drone.get_status().dict()).decode()
+        entry = orjson.dumps(drone_id).decode() + ":" + status_json
+        cached = STATUS_CACHE[drone_id] = (drone, version, status_json, entry)
+    return cached
+
+def _status_payload() -> str:
+    """Encoded status_update for all connected drones; only drones whose status changed are re-encoded."""
+    parts = []
+    drones = DRONES_SNAPSHOT
+    for drone_id, drone in drones:
+        parts.append(_cached_status(drone_id, drone)[3])
+    if len(STATUS_CACHE) > len(parts):
+        live = {drone_id for drone_id, _ in drones}
+        for drone_id in STATUS_CACHE.keys() - live:
+            del STATUS_CACHE[drone_id]
+    timestamp = orjson.dumps(datetime.datetime.utcnow()).decode()
+    return '{"type":"status_update","drones":{' + ",".join(parts) + '},"timestamp":' + timestamp + '}'
+
+async def _status_ticker():
+    """Build and encode one status_update per tick and send that same frame to every client."""
+    while True:
+        # With a shared backend, other workers' clients need this worker's drones even if it has
+        # no clients of its own; the frontend merges status_update frames per drone id
+        if manager.active_connections or (app.state.pubsub is not None and DRONES_SNAPSHOT):
+            try:
+                await _fan_out(_status_payload())
+            except Exception as e:
+                print(f"Status broadcast error: {e}")
+        await asyncio.sleep(STATUS_BROADCAST_INTERVAL_SECONDS)
+
+def _enqueue_broadcast(event_type: str, payload: str):
+    try:
+        app.state.tx_queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        print(f"Warning: broadcast queue full, dropping {event_type} event")
+
+def publish_event(obj: dict):
+    """Queue `obj` for broadcast from any thread without waiting on the clients.
+
+    The event is encoded here, on the calling (mission) thread, so the loop only does the sends.
+    """
+    publish_encoded(obj.get("type"), orjson.dumps(obj).decode())
+
+def publish_encoded(event_type: str, payload: str):
+    """Like publish_event, for a payload that is already JSON text."""
+    loop = getattr(app.state, "loop", None)
+    if loop is None or loop.is_closed():
+        return
+    loop.call_soon_threadsafe(_enqueue_broadcast, event_type, payload)
+
+def run_on_loop(coro):
+    """Schedule `coro` on the server's event loop from another thread; returns its Future."""
+    loop = getattr(app.state, "loop", None)
+    if loop is None or loop.is_closed():
+        coro.close()
+        return None
+    return asyncio.run_coroutine_threadsafe(coro, loop)
+
+async def _sync_order_status(order_id: str, status: str):
+    """PATCH the order's status on the Orders Service; failures are logged, not raised."""
+    try:
+        resp = await app.state.http.patch(
+            f"/api/orders/{order_id}",
+            json={"status": status},
+        )
+        if resp.is_error:
+            print(f"Orders service update failed: {resp.status_code} {resp.text}")
+        else:
+            print(f"Orders service updated: order {order_id} -> {status}")
+    except Exception as e:
+        print(f"Orders service update error: {e}")
+
 @app.get("/")
 async def root():
     return {
@@ -669,116 +1188,97 @@ async def root():
 @app.post("/api/launch", response_model=MissionResponse)
 async def launch_mission(request: LaunchRequest):
     """Launch a drone mission to a specific block"""
-    if request.block not in BLOCK_COORDINATES:
+    # Validate (and resolve) the block before any drone connection or DB work
+    coords = BLOCK_COORDINATES.get(request.block)
+    if coords is None:
         raise HTTPException(status_code=400, detail="Invalid block. Must be A, B, or C")
     
-    with DRONE_LOCK:
-        if request.droneId not in DRONES:
-            try:
-                DRONES[request.droneId] = DroneDelivery(request.connectionString)
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to connect to drone: {str(e)}")
-        drone = DRONES[request.droneId]
+    # dict.get is atomic; no need to take DRONE_LOCK just to look a drone up
+    drone = DRONES.get(request.droneId)
+    if drone is None:
+        # dronekit.connect blocks for up to heartbeat_timeout; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        try:
+            new_drone = await loop.run_in_executor(
+                CONNECT_EXECUTOR, DroneDelivery, request.connectionString
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to connect to drone: {str(e)}")
+        with DRONE_LOCK:
+            drone = DRONES.setdefault(request.droneId, new_drone)
+            _publish_drones()
+        if drone is not new_drone:
+            # Another request connected this drone while we were waiting; closing joins its
+            # worker thread (up to WORKER_JOIN_TIMEOUT_SECONDS) before closing the MAVLink link,
+            # so it too stays off the event loop
+            await loop.run_in_executor(CONNECT_EXECUTOR, new_drone.close_connection)
     
-    coords = BLOCK_COORDINATES[request.block]
-    session = SessionLocal()
-    order = Order(drone_id=request.droneId, block=request.block, status='IN_PROGRESS')
-    session.add(order)
-    session.commit()
-    order_id = order.id
-
-    def notify_user():
-        asyncio.run(manager.broadcast(json.dumps({
-            "type": "arrived_at_block",
-            "drone_id": request.droneId,
-            "order_id": order_id,
-            "block": request.block
-        })))
+    # The insert can wait on SQLite's write lock, so it runs in the threadpool
+    order_id = await run_in_threadpool(create_order, request.droneId, request.block)
 
     def mission():
-        try:
-            def mark_delivered():
-                # Update local order status in this service (debug/info)
-                try:
-                    session = SessionLocal()
-                    o = session.query(Order).get(order_id)
-                    if o:
-                        o.status = 'DELIVERED'
-                        o.completed_at = datetime.datetime.utcnow()
-                        session.commit()
-                    session.close()
-                except Exception as e:
-                    print(f"Warning: failed to update local order record: {e}")
+        # Events whose content is fixed for the whole mission are encoded once, up front
+        drone_json = orjson.dumps(request.droneId).decode()
+        block_json = orjson.dumps(request.block).decode()
+        arrived_payload = ARRIVED_TEMPLATE % (drone_json, order_id, block_json)
+        completed_payload = COMPLETED_TEMPLATE % (drone_json, order_id, block_json)
 
-                # Also notify the Orders Service (port 8001) if request.orderId is provided
-                if request.orderId:
+        def notify_user():
+            publish_encoded("arrived_at_block", arrived_payload)
+
+        # One session per mission; the delivered/completed/failed transitions are its commit points
+        with mission_transaction(order_id) as checkpoint:
+            try:
+                def mark_delivered():
+                    # Update local order status in this service (debug/info)
                     try:
-                        ORDERS_API_BASE = os.getenv("ORDERS_API_BASE", "http://127.0.0.1:8001")
-                        resp = requests.patch(
-                            f"{ORDERS_API_BASE}/api/orders/{request.orderId}",
-                            json={"status": "Delivered"},
-                            timeout=5,
-                        )
-                        if not resp.ok:
-                            print(f"Orders service update failed: {resp.status_code} {resp.text}")
-                        else:
-                            print(f"Orders service updated: order {request.orderId} -> Delivered")
+                        checkpoint(status='DELIVERED', completed_at=datetime.datetime.utcnow())
                     except Exception as e:
-                        print(f"Orders service update error: {e}")
-
-                # Broadcast to any listeners on this service
-                asyncio.run(manager.broadcast(json.dumps({
-                    "type": "order_delivered",
-                    "drone_id": request.droneId,
-                    "order_id": request.orderId or order_id,
-                })))
-
-            drone.perform_delivery(coords, HOME_LOCATION, notify_callback=notify_user, delivered_callback=mark_delivered)
-            session = SessionLocal()
-            order = session.query(Order).get(order_id)
-            order.status = 'COMPLETED'
-            order.completed_at = datetime.datetime.utcnow()
-            session.commit()
-            session.close()
-            asyncio.run(manager.broadcast(json.dumps({
-                "type": "mission_completed",
-                "drone_id": request.droneId,
-                "order_id": order_id,
-                "block": request.block
-            })))
-        except Exception as e:
-            session = SessionLocal()
-            order = session.query(Order).get(order_id)
-            order.status = f'FAILED: {str(e)}'
-            session.commit()
-            session.close()
-            print(f"Mission error for {request.droneId}: {e}")
-            asyncio.run(manager.broadcast(json.dumps({
-                "type": "mission_failed",
-                "drone_id": request.droneId,
-                "order_id": order_id,
-                "error": str(e)
-            })))
-    t = threading.Thread(target=mission)
-    t.start()
-    session.close()
+                        print(f"Warning: failed to update local order record: {e}")
+
+                    # Also notify the Orders Service (port 8001) if request.orderId is provided;
+                    # the PATCH runs on the event loop so a slow service can't hold up the mission
+                    if request.orderId:
+                        run_on_loop(_sync_order_status(request.orderId, "Delivered"))
+
+                    # Broadcast to any listeners on this service
+                    publish_encoded("order_delivered", DELIVERED_TEMPLATE % (
+                        drone_json, orjson.dumps(request.orderId or order_id).decode()))
+
+                drone.perform_delivery(coords, HOME_LOCATION, notify_callback=notify_user, delivered_callback=mark_delivered)
+                checkpoint(status='COMPLETED', completed_at=datetime.datetime.utcnow())
+                publish_encoded("mission_completed", completed_payload)
+            except Exception as e:
+                print(f"Mission error for {request.droneId}: {e}")
+                # Published first so listeners hear about the failure even if recording it fails
+                publish_encoded("mission_failed", FAILED_TEMPLATE % (
+                    drone_json, order_id, orjson.dumps(str(e)).decode()))
+                try:
+                    checkpoint(status=f'FAILED: {str(e)}')
+                except Exception as db_error:
+                    print(f"Warning: failed to record mission failure for order {order_id}: {db_error}")
+    # Runs on the drone's worker thread, after any mission already queued for it
+    fut = drone.submit(mission)
+    MISSION_FUTURES.add(fut)
+    fut.add_done_callback(MISSION_FUTURES.discard)
     
     return MissionResponse(
         status=f"Mission started for drone {request.droneId}",
         order_id=order_id
     )
 
-@app.post("/api/status", response_model=DroneStatus)
+@app.post("/api/status", response_model=None, responses={200: {"model": DroneStatus}})
 async def get_drone_status(request: StatusRequest):
     """Get the current status of a drone or connect to it"""
     # If drone is not in memory, try to connect to it
-    if request.droneId not in DRONES:
+    drone = DRONES.get(request.droneId)
+    if drone is None:
         # For now, we'll create a mock connection since we can't connect without connection string
         # In a real scenario, you'd need to pass the connection string
         raise HTTPException(status_code=404, detail="Drone not connected. Please provide connection string.")
     
-    drone = DRONES[request.droneId]
-    return drone.get_status()
+    # Same encoded status the WebSocket ticker uses; skips response_model re-validation
+    return Response(content=_cached_status(request.droneId, drone)[2], media_type="application/json")
 
 @app.post("/api/connect")
 async def connect_drone(request: LaunchRequest):
@@ -786,18 +1286,29 @@ async def connect_drone(request: LaunchRequest):
     if not request.connectionString or not isinstance(request.connectionString, str):
         raise HTTPException(status_code=400, detail="Invalid connection string.")
     try:
+        # Closing and opening MAVLink links block; run them on the connect pool, not the event loop
+        loop = asyncio.get_running_loop()
         with DRONE_LOCK:
-            if request.droneId in DRONES:
-                DRONES[request.droneId].close_connection()
-            # Try connecting and catch errors
-            try:
-                drone = DroneDelivery(request.connectionString)
-            except Exception as e:
-                print(f"[ERROR] Failed to connect to drone {request.droneId}: {e}")
-                import traceback
-                traceback.print_exc()
-                raise HTTPException(status_code=500, detail=f"Failed to connect to drone: {str(e)}")
+            old = DRONES.pop(request.droneId, None)
+            _publish_drones()
+        if old is not None:
+            # Release the old link first: a serial port can only be opened once
+            await loop.run_in_executor(CONNECT_EXECUTOR, old.close_connection)
+        # Try connecting and catch errors
+        try:
+            drone = await loop.run_in_executor(CONNECT_EXECUTOR, DroneDelivery, request.connectionString)
+        except Exception as e:
+            print(f"[ERROR] Failed to connect to drone {request.droneId}: {e}")
+            import traceback
+            traceback.print_exc()
+            raise HTTPException(status_code=500, detail=f"Failed to connect to drone: {str(e)}")
+        with DRONE_LOCK:
+            replaced = DRONES.get(request.droneId)
             DRONES[request.droneId] = drone
+            _publish_drones()
+        if replaced is not None:
+            # A concurrent connect for the same id finished first; ours wins, theirs is closed
+            await loop.run_in_executor(CONNECT_EXECUTOR, replaced.close_connection)
         return {"status": f"Successfully connected to drone {request.droneId}", "drone_id": request.droneId}
     except HTTPException as he:
         raise he
@@ -809,47 +1320,42 @@ async def connect_drone(request: LaunchRequest):
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time drone updates"""
-    await manager.connect(websocket)
+    """WebSocket endpoint for real-time drone updates (JSON text; ?format=msgpack for binary frames)"""
+    binary = websocket.query_params.get("format") == "msgpack" and msgpack is not None
+    await manager.connect(websocket, binary=binary)
     try:
+        # Current snapshot right away; after that the shared status ticker sends periodic updates
+        await manager.send_personal_message(_status_payload(), websocket)
         while True:
-            # Send periodic status updates for all connected drones
-            status_updates = {}
-            with DRONE_LOCK:
-                for drone_id, drone in DRONES.items():
-                    if drone.is_connected:
-                        status_updates[drone_id] = drone.get_status().dict()
-            
-            await websocket.send_text(json.dumps({
-                "type": "status_update",
-                "drones": status_updates,
-                "timestamp": datetime.datetime.utcnow().isoformat()
-            }))
-            
-            await asyncio.sleep(2)  # Update every 2 seconds
-            
+            # Nothing is expected from the client; keep reading only to notice the disconnect
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
+    finally:
+        await manager.disconnect(websocket)
 
 @app.get("/api/drones")
 async def list_drones():
     """List all connected drones"""
-    with DRONE_LOCK:
-        return {
-            "connected_drones": list(DRONES.keys()),
-            "total_count": len(DRONES)
-        }
+    drones = DRONES_SNAPSHOT
+    return {
+        "connected_drones": [drone_id for drone_id, _ in drones],
+        "total_count": len(drones)
+    }
 
 @app.delete("/api/drones/{drone_id}")
 async def disconnect_drone(drone_id: str):
     """Disconnect a specific drone"""
     with DRONE_LOCK:
-        if drone_id in DRONES:
-            DRONES[drone_id].close_connection()
-            del DRONES[drone_id]
-            return {"message": f"Drone {drone_id} disconnected"}
-        else:
-            raise HTTPException(status_code=404, detail="Drone not found")
+        drone = DRONES.pop(drone_id, None)
+        if drone is not None:
+            _publish_drones()
+    if drone is None:
+        raise HTTPException(status_code=404, detail="Drone not found")
+    await asyncio.get_running_loop().run_in_executor(CONNECT_EXECUTOR, drone.close_connection)
+    return {"message": f"Drone {drone_id} disconnected"}
 
 if __name__ == "__main__":
     import uvicorn
@@ -870,7 +1376,21 @@ if __name__ == "__main__":
     print(f"📚 API Documentation: http://{host}:{port}/docs")
     
     try:
-        uvicorn.run(app, host=host, port=port, log_level="info")
+        # Frames are small JSON and identical across clients: deflating each client's copy
+        # separately costs more CPU than it saves on the wire.
+        # "auto" picks uvloop, httptools and websockets from uvicorn[standard] (falling back to
+        # asyncio on Windows, where uvloop isn't available); per-request access logs only with ACCESS_LOG=1.
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            log_level=os.getenv("LOG_LEVEL", "info").lower(),
+            loop="auto",
+            http="auto",
+            ws="auto",
+            access_log=os.getenv("ACCESS_LOG", "0") == "1",
+            ws_per_message_deflate=False,
+        )
     except Exception as e:
         print(f"Error starting server: {e}")
         import traceback
@@ -1,6 +1,6 @@
 from dronekit import connect, VehicleMode
 from pymavlink import mavutil
-import time
+import threading
 
 # Connect to the Vehicle over UDP
 print("Connecting to vehicle...")
@@ -8,14 +8,19 @@ print("Connecting to vehicle...")
 # Companion computer example: udp:<IP>:14550
 vehicle = connect('udp:127.0.0.1:14550', wait_ready=True)
 
-def set_servo(channel: int, pwm_value: int):
+# Longest to wait for the FCU to confirm each step before moving on (seconds)
+STEP_TIMEOUT_SECONDS = 3.0
+# How long to hold each servo position once the FCU has confirmed it, so the servo
+# physically reaches it and the move can be seen (seconds)
+SERVO_DWELL_SECONDS = 1.0
+
+def servo_msg(channel: int, pwm_value: int):
     """
-    Sets a servo connected to a specified channel to a given PWM value.
+    Builds the MAV_CMD_DO_SET_SERVO command for a channel/PWM pair.
     :param channel: The servo channel (e.g., 9 for SERVO9)
     :param pwm_value: The PWM value (1000–2000 µs typical)
     """
-    print(f"Setting servo at channel {channel} to PWM {pwm_value}")
-    msg = vehicle.message_factory.command_long_encode(
+    return vehicle.message_factory.command_long_encode(
         0, 0,                                   # target system, target component
         mavutil.mavlink.MAV_CMD_DO_SET_SERVO,   # command
         0,                                      # confirmation
@@ -23,22 +28,57 @@ def set_servo(channel: int, pwm_value: int):
         pwm_value,                              # PWM value
         0, 0, 0, 0, 0                           # unused parameters
     )
-    vehicle.send_mavlink(msg)
-    vehicle.flush()
+
+def set_servo(channel: int, pwm_value: int, msg=None) -> bool:
+    """
+    Sets a servo and waits until SERVO_OUTPUT_RAW reports the new PWM on that channel.
+    Returns False if the FCU doesn't report it within STEP_TIMEOUT_SECONDS.
+    """
+    print(f"Setting servo at channel {channel} to PWM {pwm_value}")
+    reached = threading.Event()
+    field = f"servo{channel}_raw"
+
+    def _output_cb(_vehicle, _name, out):
+        if getattr(out, field, None) == pwm_value:
+            reached.set()
+
+    vehicle.add_message_listener('SERVO_OUTPUT_RAW', _output_cb)
+    try:
+        vehicle.send_mavlink(msg if msg is not None else servo_msg(channel, pwm_value))
+        return reached.wait(STEP_TIMEOUT_SECONDS)
+    finally:
+        vehicle.remove_message_listener('SERVO_OUTPUT_RAW', _output_cb)
+
+def wait_for_armed(armed: bool) -> bool:
+    """Waits until the vehicle reports the requested armed state (or STEP_TIMEOUT_SECONDS pass)."""
+    changed = threading.Event()
+
+    def _armed_cb(_vehicle, _name, value):
+        if value == armed:
+            changed.set()
+
+    vehicle.add_attribute_listener('armed', _armed_cb)
+    try:
+        if vehicle.armed == armed:
+            return True
+        return changed.wait(STEP_TIMEOUT_SECONDS)
+    finally:
+        vehicle.remove_attribute_listener('armed', _armed_cb)
 
 # Example usage
 print("Arming vehicle...")
 vehicle.mode = VehicleMode("GUIDED")
 vehicle.armed = True
-time.sleep(3)
+if not wait_for_armed(True):
+    print("Vehicle did not report armed; continuing anyway")
 
 print("Moving servo...")
-set_servo(10, 1500)  # Midpoint
-time.sleep(2)
-set_servo(10, 2000)  # Max
-time.sleep(2)
-set_servo(10, 1000)  # Min
-time.sleep(2)
+# Encode the sweep up front; each step holds for SERVO_DWELL_SECONDS once the FCU reports the new output
+sweep = [(10, pwm, servo_msg(10, pwm)) for pwm in (1500, 2000, 1000)]  # Midpoint, Max, Min
+for channel, pwm, msg in sweep:
+    if not set_servo(channel, pwm, msg):
+        print(f"No SERVO_OUTPUT_RAW confirmation for PWM {pwm}")
+    threading.Event().wait(SERVO_DWELL_SECONDS)
 
 print("Disarming vehicle...")
 vehicle.armed = False
@@ -0,0 +1,75 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from starlette.websockets import WebSocketState
+
+# main binds its SQLite file relative to the working directory at import time, so import it
+# from a scratch directory to keep the test from touching a real drone_orders.db
+_TMP = tempfile.TemporaryDirectory()
+_CWD = os.getcwd()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.chdir(_TMP.name)
+try:
+    import main  # noqa: E402
+finally:
+    os.chdir(_CWD)
+
+
+class FakeWebSocket:
+    """Just enough of a starlette WebSocket for ConnectionManager."""
+
+    def __init__(self, stall: bool = False):
+        self.stall = stall
+        self.sent = []
+        self.closed = False
+        self.client_state = WebSocketState.CONNECTED
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        if self.stall:
+            # A client that stopped reading: the send never completes
+            await asyncio.Event().wait()
+        self.sent.append(message)
+
+    send_bytes = send_text
+
+    async def close(self, code: int = 1000):
+        self.closed = True
+        self.client_state = WebSocketState.DISCONNECTED
+
+
+class StalledClientTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._timeout = main.BROADCAST_SEND_TIMEOUT_SECONDS
+        main.BROADCAST_SEND_TIMEOUT_SECONDS = 0.05
+        self.manager = main.ConnectionManager()
+
+    def tearDown(self):
+        main.BROADCAST_SEND_TIMEOUT_SECONDS = self._timeout
+
+    async def test_stalled_client_is_closed_and_dropped(self):
+        healthy, stalled = FakeWebSocket(), FakeWebSocket(stall=True)
+        await self.manager.connect(healthy)
+        await self.manager.connect(stalled)
+
+        await self.manager.broadcast('{"type":"status"}')
+        await asyncio.sleep(0.2)
+
+        self.assertTrue(stalled.closed)
+        self.assertNotIn(stalled, self.manager.active_connections)
+        self.assertNotIn(stalled, self.manager._pumps)
+        self.assertFalse(healthy.closed)
+        self.assertEqual(healthy.sent, ['{"type":"status"}'])
+        self.assertIn(healthy, self.manager.active_connections)
+
+        await self.manager.disconnect(healthy)
+
+
+if __name__ == "__main__":
+    unittest.main()
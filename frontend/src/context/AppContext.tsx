@@ -59,11 +59,20 @@ export const AppProvider: FC<{children: ReactNode}> = ({ children }) => {
   // --- Load existing orders from backend on app start ---
   useEffect(() => {
     if (!API_BASE) return;
-    fetch(`${API_BASE}/api/orders`)
-      .then(res => {
+    // The list is paginated: keep following X-Next-Cursor until the last page
+    const fetchAllOrders = async (): Promise<any[]> => {
+      const all: any[] = [];
+      let cursor: string | null = null;
+      do {
+        const query: string = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+        const res: Response = await fetch(`${API_BASE}/api/orders?limit=200${query}`);
         if (!res.ok) throw new Error(`Fetch orders failed: ${res.status}`);
-        return res.json();
-      })
+        all.push(...(await res.json()));
+        cursor = res.headers.get('X-Next-Cursor');
+      } while (cursor);
+      return all;
+    };
+    fetchAllOrders()
       .then((data: any[]) => {
         const normalized: Order[] = data.map((o: any) => ({ ...o, createdAt: new Date(o.createdAt) }));
         setOrders(normalized);
@@ -508,31 +517,38 @@ export const AppProvider: FC<{children: ReactNode}> = ({ children }) => {
     const wsBase = (DRONE_API_BASE || 'http://127.0.0.1:8080').replace(/^http/, 'ws');
     const ws = new WebSocket(`${wsBase}/ws`);
     ws.onopen = () => logActivity('Connected to drone status WebSocket.');
+    const handleMessage = (msg: any) => {
+      if (msg?.type === 'batch' && Array.isArray(msg.msgs)) {
+        // Backend merges messages queued for a slow client into one frame
+        msg.msgs.forEach(handleMessage);
+        return;
+      }
+      if (msg?.type === 'status_update' && msg.drones) {
+        setDrones(prev => {
+          const next = [...prev];
+          Object.entries<any>(msg.drones).forEach(([droneId, data]) => {
+            const idx = next.findIndex(d => d.id === droneId);
+            if (idx !== -1) {
+              const d = next[idx];
+              next[idx] = {
+                ...d,
+                status: data.armed ? DroneStatus.ON_MISSION : DroneStatus.IDLE,
+                battery: typeof data.battery === 'number' ? data.battery : d.battery,
+                isConnected: true,
+                location: data.location && data.location.lat && data.location.lon ? {
+                  lat: data.location.lat,
+                  lon: data.location.lon,
+                } : d.location,
+              };
+            }
+          });
+          return next;
+        });
+      }
+    };
     ws.onmessage = (e) => {
       try {
-        const msg = JSON.parse(e.data);
-        if (msg?.type === 'status_update' && msg.drones) {
-          setDrones(prev => {
-            const next = [...prev];
-            Object.entries<any>(msg.drones).forEach(([droneId, data]) => {
-              const idx = next.findIndex(d => d.id === droneId);
-              if (idx !== -1) {
-                const d = next[idx];
-                next[idx] = {
-                  ...d,
-                  status: data.armed ? DroneStatus.ON_MISSION : DroneStatus.IDLE,
-                  battery: typeof data.battery === 'number' ? data.battery : d.battery,
-                  isConnected: true,
-                  location: data.location && data.location.lat && data.location.lon ? {
-                    lat: data.location.lat,
-                    lon: data.location.lon,
-                  } : d.location,
-                };
-              }
-            });
-            return next;
-          });
-        }
+        handleMessage(JSON.parse(e.data));
       } catch (_) {
         // ignore parse errors
       }